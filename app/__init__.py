@@ -9,8 +9,11 @@ configurations, blueprints, and extensions.
 
 import os
 import logging
+import importlib
 from flask import Flask
 from config import get_config
+from app.json_provider import OrjsonProvider
+from app.logging_handlers import attach_queue_handler
 
 
 def create_app(config_name=None):
@@ -24,6 +27,7 @@ def create_app(config_name=None):
         Flask application instance
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     config_class = get_config(config_name)
@@ -35,9 +39,17 @@ def create_app(config_name=None):
     # Setup logging
     setup_logging(app)
 
+    # Setup cache backend
+    init_redis(app)
+    init_cache_service(app)
+    init_response_cache(app)
+
     # Register blueprints
     register_blueprints(app)
 
+    # Warm up NLP models before serving traffic
+    preload_models(app)
+
     # Register error handlers
     register_error_handlers(app)
 
@@ -51,23 +63,114 @@ def setup_logging(app):
         if not os.path.exists('logs'):
             os.mkdir('logs')
 
-        # Setup file logging
+        # Setup file logging; records are written by a background listener
         file_handler = logging.FileHandler('logs/youtube_summarizer.log')
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
         ))
         file_handler.setLevel(logging.INFO)
-        app.logger.addHandler(file_handler)
+        app.extensions['log_listener'] = attach_queue_handler(
+            app.logger,
+            file_handler,
+            capacity=app.config.get('LOG_BUFFER_CAPACITY', 100),
+            flush_interval=app.config.get('LOG_FLUSH_INTERVAL', 1.0)
+        )
 
         app.logger.setLevel(logging.INFO)
         app.logger.info('YouTube Summarizer startup')
 
 
+def init_redis(app):
+    """
+    Create the shared Redis clients when the Redis cache backend is enabled.
+
+    Each client is backed by a connection pool created once per process,
+    so requests reuse open connections instead of connecting on demand.
+    """
+    if not app.config.get('CACHE_ENABLED', True) or app.config.get('CACHE_BACKEND') != 'redis':
+        return
+
+    import redis
+    pool_options = {
+        'max_connections': int(app.config.get('REDIS_POOL_SIZE', 32)),
+        'health_check_interval': int(app.config.get('REDIS_HEALTH_CHECK_INTERVAL', 30)),
+        'socket_keepalive': True
+    }
+
+    # Summary data is stored as text, serialized responses as bytes
+    pool = redis.ConnectionPool.from_url(app.config['REDIS_URL'], decode_responses=True, **pool_options)
+    response_pool = redis.ConnectionPool.from_url(app.config['REDIS_URL'], **pool_options)
+
+    app.extensions['redis_pool'] = pool
+    app.extensions['redis'] = redis.Redis(connection_pool=pool)
+    app.extensions['redis_responses'] = redis.Redis(connection_pool=response_pool)
+
+
+def init_cache_service(app):
+    """Attach the summary cache service shared by all views."""
+    from app.services.cache_service import CacheService
+
+    cache_service = CacheService()
+    cache_service.init_app(app)
+    app.extensions['cache_service'] = cache_service
+
+
+def init_response_cache(app):
+    """Bind the summarize response cache to the configured cache backend."""
+    from app.extensions import response_cache
+
+    if not app.config.get('CACHE_ENABLED', True):
+        cache_config = {'CACHE_TYPE': 'NullCache'}
+    elif app.config.get('CACHE_BACKEND') == 'redis':
+        # Flask-Caching accepts a ready client in place of a host name
+        cache_config = {
+            'CACHE_TYPE': 'RedisCache',
+            'CACHE_REDIS_HOST': app.extensions['redis_responses']
+        }
+    else:
+        cache_config = {'CACHE_TYPE': 'SimpleCache'}
+
+    cache_config['CACHE_KEY_PREFIX'] = 'resp:'
+    cache_config['CACHE_DEFAULT_TIMEOUT'] = app.config.get('CACHE_DURATION_HOURS', 24) * 3600
+    response_cache.init_app(app, config=cache_config)
+
+
+def preload_models(app):
+    """
+    Load the summarization models when PRELOAD_MODELS is enabled.
+
+    With gunicorn's preload_app the models are loaded once in the master
+    process and shared copy-on-write with every forked worker.
+    """
+    if not app.config.get('PRELOAD_MODELS', False):
+        return
+
+    from app.services.summary_service import SummaryService
+    # Within the app context, so the app's model settings are used
+    with app.app_context():
+        SummaryService.warmup()
+
+
+# Blueprints that can be enabled through ENABLED_BLUEPRINTS, as "module:attribute"
+BLUEPRINTS = {
+    'api': 'app.api:api_bp',
+}
+
+
 def register_blueprints(app):
-    """Register application blueprints."""
-    # Register API blueprint
-    from app.api import api_bp
-    app.register_blueprint(api_bp)
+    """
+    Register the blueprints listed in ENABLED_BLUEPRINTS.
+
+    Blueprint modules are only imported when enabled, so workers that
+    serve a subset of the application skip the others entirely.
+    """
+    for name in app.config.get('ENABLED_BLUEPRINTS', list(BLUEPRINTS)):
+        if name not in BLUEPRINTS:
+            raise ValueError(f"Unknown blueprint in ENABLED_BLUEPRINTS: {name}")
+
+        module_name, attribute = BLUEPRINTS[name].split(':')
+        blueprint = getattr(importlib.import_module(module_name), attribute)
+        app.register_blueprint(blueprint)
 
 
 def register_error_handlers(app):
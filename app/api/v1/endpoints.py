@@ -6,20 +6,100 @@ API v1 endpoints for YouTube Summarizer.
 This module contains all REST API endpoints for version 1.
 """
 
-from flask import request, jsonify, current_app
-from datetime import datetime
+from flask import request, jsonify, current_app, Response
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
 import time
+import orjson
 
 from . import api_v1_bp
-from app.services.video_service import VideoService
-from app.services.summary_service import SummaryService
-from app.services.cache_service import CacheService
-from app.models.summary import SummaryRequest, SummaryResponse, SummaryStatus
-from app.models.video import Video, VideoInfo
+from app.extensions import (
+    response_cache, summary_cache_key_for, summary_cache_variant, get_cached_response,
+    store_cached_response, delete_cached_responses, get_cache_service
+)
+from app.json_provider import ORJSON_OPTIONS, json_response, json_prefix, load_request_json
+from app.utils.timestamps import utc_now_iso
 
+# The video/summary services pull in the NLP and download stack, so they
+# are imported inside the endpoints that need them. This keeps app start-up
+# and lightweight endpoints such as /health free of that cost.
+if TYPE_CHECKING:
+    from app.services.video_service import VideoService
+    from app.services.summary_service import SummaryService
+    from app.models.summary import SummaryRequest, SummaryResponse, SummaryStatus
 
-# Initialize services
-cache_service = CacheService()
+
+# Background workers that refresh stale cache entries
+refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='summary-refresh')
+
+# Endpoint whose responses are stored in the response cache, and the request
+# options that shape those responses (each combination is stored separately)
+SUMMARIZE_ENDPOINT = 'api.api_v1.summarize_video'
+SUMMARY_RESPONSE_OPTIONS = ('summary_type', 'max_length', 'include_keywords', 'language')
+
+# Health response up to its timestamp, which is the only per-request value
+_HEALTH_PREFIX = json_prefix({
+    'status': 'healthy',
+    'version': '1.0.0',
+    'service': 'YouTube Summarizer API v1'
+}, 'timestamp')
+
+# API information never changes, so it is serialized once
+_INFO_BYTES = orjson.dumps({
+    'name': 'YouTube Summarizer API',
+    'version': '1.0.0',
+    'description': 'AI-powered YouTube video summarization service',
+    'endpoints': {
+        'health': '/api/v1/health',
+        'info': '/api/v1/info',
+        'summarize': '/api/v1/summarize',
+        'video_info': '/api/v1/video/{video_id}',
+        'cache_stats': '/api/v1/cache/stats',
+        'batch_summarize': '/api/v1/batch/summarize'
+    },
+    'documentation': '/docs/api',
+    'support': 'https://github.com/your-username/Youtube_Summary_Project'
+}, option=ORJSON_OPTIONS)
+
+
+def _schedule_refresh(url):
+    """
+    Refresh a stale cache entry in the background.
+    
+    Only one refresh per URL runs at a time; concurrent requests keep
+    being served the stale entry until it completes.
+    
+    Args:
+        url: YouTube URL whose cache entry is stale
+    """
+    token = get_cache_service().acquire_refresh_lock(url)
+    if token is None:
+        return
+    
+    app = current_app._get_current_object()
+    try:
+        refresh_executor.submit(_refresh_summary, app, url, token)
+    except RuntimeError:
+        # Executor is shutting down
+        get_cache_service().release_refresh_lock(url, token)
+
+
+def _refresh_summary(app, url, token):
+    """Regenerate and re-cache the summary for a URL."""
+    from app.services.video_service import VideoService
+    from app.services.summary_service import SummaryService
+    
+    with app.app_context():
+        try:
+            transcript, video_info = VideoService.get_video_data(url)
+            summary_text, keywords = SummaryService.generate_summary_shared(transcript, video_info, key=url)
+            get_cache_service().cache_summary(url, summary_text, keywords, video_info)
+            # Stored responses were built from the old entry
+            delete_cached_responses(summary_cache_key_for(SUMMARIZE_ENDPOINT, url))
+        except Exception as e:
+            app.logger.warning(f"Failed to refresh cached summary: {str(e)}")
+        finally:
+            get_cache_service().release_refresh_lock(url, token)
 
 
 @api_v1_bp.route('/health', methods=['GET'])
@@ -30,12 +110,7 @@ def health_check():
     Returns:
         JSON response with health status
     """
-    return jsonify({
-        'status': 'healthy',
-        'version': '1.0.0',
-        'timestamp': datetime.utcnow().isoformat(),
-        'service': 'YouTube Summarizer API v1'
-    })
+    return Response(_HEALTH_PREFIX + utc_now_iso().encode('ascii') + b'"}', mimetype='application/json')
 
 
 @api_v1_bp.route('/info', methods=['GET'])
@@ -46,76 +121,33 @@ def api_info():
     Returns:
         JSON response with API information
     """
-    return jsonify({
-        'name': 'YouTube Summarizer API',
-        'version': '1.0.0',
-        'description': 'AI-powered YouTube video summarization service',
-        'endpoints': {
-            'health': '/api/v1/health',
-            'info': '/api/v1/info',
-            'summarize': '/api/v1/summarize',
-            'video_info': '/api/v1/video/{video_id}',
-            'cache_stats': '/api/v1/cache/stats'
-        },
-        'documentation': '/docs/api',
-        'support': 'https://github.com/your-username/Youtube_Summary_Project'
-    })
+    return Response(_INFO_BYTES, mimetype='application/json')
 
 
-@api_v1_bp.route('/summarize', methods=['POST'])
-def summarize_video():
+def _summarize(summary_request, start_time):
     """
-    Summarize a YouTube video.
+    Produce the summary response data for a request.
     
-    Request Body:
-        {
-            "url": "https://www.youtube.com/watch?v=VIDEO_ID",
-            "summary_type": "enhanced",  # optional
-            "max_length": 200,           # optional
-            "include_keywords": true,    # optional
-            "language": "en"             # optional
-        }
+    Serves the cached summary when available (scheduling a background
+    refresh for stale entries), otherwise fetches the video, generates the
+    summary and caches it. Concurrent misses for the same URL are coalesced
+    so the summary is only generated once.
+    
+    Args:
+        summary_request: Validated SummaryRequest
+        start_time: Request start time, used for processing statistics
     
     Returns:
-        JSON response with summary data
+        Tuple[dict, int, Optional[dict]]: Response data, HTTP status code and
+            the cache entry the data was built from (None if generated)
     """
-    start_time = time.time()
+    from app.services.video_service import VideoService
+    from app.services.summary_service import SummaryService
+    from app.models.summary import Summary, SummaryResponse, SummaryStatus
     
-    try:
-        # Validate request
-        if not request.is_json:
-            return jsonify({'error': 'Content-Type must be application/json'}), 400
-        
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'Request body is required'}), 400
-        
-        # Create summary request object
-        try:
-            summary_request = SummaryRequest.from_dict(data)
-        except ValueError as e:
-            return jsonify({'error': str(e)}), 400
-        
-        # Check cache first
-        if current_app.config.get('CACHE_ENABLED', True):
-            cached_result = cache_service.get_cached_summary(summary_request.url)
-            if cached_result:
-                processing_time = time.time() - start_time
-                
-                # Create response from cache
-                response = SummaryResponse(
-                    summary=cached_result['summary'],
-                    video_info=cached_result['video_info'],
-                    status=SummaryStatus.CACHED,
-                    cached=True,
-                    processing_stats={
-                        'processing_time': processing_time,
-                        'cached_at': cached_result['cached_at']
-                    }
-                )
-                
-                return jsonify(response.to_dict())
-        
+    cache_enabled = current_app.config.get('CACHE_ENABLED', True)
+    
+    def generate():
         # Get video data
         try:
             transcript, video_info = VideoService.get_video_data(summary_request.url)
@@ -124,22 +156,23 @@ def summarize_video():
                 str(e), 
                 {'title': 'Unknown', 'channel': 'Unknown', 'description': ''}
             )
-            return jsonify(error_response.to_dict()), 500
+            return error_response.to_dict(), 500, None
         
         # Generate summary
         try:
-            summary_text, keywords = SummaryService.generate_summary(transcript, video_info)
+            summary_text, keywords = SummaryService.generate_summary_shared(
+                transcript, video_info, key=summary_request.url
+            )
         except Exception as e:
             error_response = SummaryResponse.create_error_response(
                 f"Failed to generate summary: {str(e)}", 
                 video_info
             )
-            return jsonify(error_response.to_dict()), 500
+            return error_response.to_dict(), 500, None
         
         processing_time = time.time() - start_time
         
         # Create summary object
-        from app.models.summary import Summary
         summary = Summary(
             content=summary_text,
             keywords=keywords.split(', ') if keywords else [],
@@ -160,15 +193,120 @@ def summarize_video():
         )
         
         # Cache the result
-        if current_app.config.get('CACHE_ENABLED', True):
-            cache_service.cache_summary(
+        if cache_enabled:
+            get_cache_service().cache_summary(
                 summary_request.url,
                 summary_text,
                 keywords,
                 video_info
             )
         
-        return jsonify(response.to_dict())
+        return response.to_dict(), 200, None
+    
+    if not cache_enabled:
+        return generate()
+    
+    # Check cache first, generating the summary once if it is missing
+    cached_result, generated = get_cache_service().coalesced_get_or_compute(summary_request.url, generate)
+    if cached_result is None:
+        return generated
+    
+    processing_time = time.time() - start_time
+    
+    # Create response from cache
+    response = SummaryResponse(
+        summary=cached_result['summary'],
+        video_info=cached_result['video_info'],
+        status=SummaryStatus.CACHED,
+        cached=True,
+        processing_stats={
+            'processing_time': processing_time,
+            'cached_at': cached_result['cached_at']
+        }
+    )
+    
+    if cached_result['stale']:
+        _schedule_refresh(summary_request.url)
+    
+    return response.to_dict(), 200, cached_result
+
+
+def _with_processing_time(payload, processing_time):
+    """Set the processing time of a stored cached-summary payload to this request's."""
+    stats = payload.get('processing_stats')
+    if isinstance(stats, dict):
+        stats['processing_time'] = processing_time
+    return payload
+
+
+@api_v1_bp.route('/summarize', methods=['POST'])
+def summarize_video():
+    """
+    Summarize a YouTube video.
+    
+    Request Body:
+        {
+            "url": "https://www.youtube.com/watch?v=VIDEO_ID",
+            "summary_type": "enhanced",  # optional
+            "max_length": 200,           # optional
+            "include_keywords": true,    # optional
+            "language": "en"             # optional
+        }
+    
+    Responses built from a fresh cache entry are stored in the response
+    cache, per URL and response-shaping options, and later identical
+    requests are served from it after validation. Stale cache entries are
+    returned immediately while a background refresh runs.
+    
+    Returns:
+        JSON response with summary data
+    """
+    start_time = time.time()
+    
+    from app.models.summary import SummaryRequest
+    
+    try:
+        # Validate request
+        if not request.is_json:
+            return jsonify({'error': 'Content-Type must be application/json'}), 400
+        
+        try:
+            data = load_request_json()
+        except ValueError:
+            return jsonify({'error': 'Request body must be valid JSON'}), 400
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+        
+        # Create summary request object
+        try:
+            summary_request = SummaryRequest.from_dict(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        cache_enabled = current_app.config.get('CACHE_ENABLED', True)
+        cache_key = summary_cache_key_for(SUMMARIZE_ENDPOINT, summary_request.url)
+        variant = summary_cache_variant({
+            name: getattr(summary_request, name, None) for name in SUMMARY_RESPONSE_OPTIONS
+        })
+        
+        if cache_enabled:
+            body = get_cached_response(cache_key, variant)
+            if body is not None:
+                return json_response(_with_processing_time(orjson.loads(body), time.time() - start_time))
+        
+        payload, status_code, cached_result = _summarize(summary_request, start_time)
+        
+        response = json_response(payload, status_code)
+        if cached_result is not None:
+            if cached_result['stale']:
+                response.headers['Warning'] = '110 - "Response is Stale"'
+            elif cache_enabled and cached_result['fresh_seconds'] >= 1:
+                # Never outlive the entry's fresh window, so staleness and
+                # background refreshes are seen by later requests
+                store_cached_response(cache_key, variant, response.get_data(),
+                                      timeout=int(cached_result['fresh_seconds']))
+        
+        return response
         
     except Exception as e:
         current_app.logger.error(f"Unexpected error in summarize_video: {str(e)}")
@@ -180,12 +318,17 @@ def get_video_info(video_id):
     """
     Get video information without summarization.
     
+    Video information is cached for ``VIDEO_INFO_CACHE_SECONDS``. If
+    YouTube cannot be reached, the last known information is returned.
+    
     Args:
         video_id: YouTube video ID
     
     Returns:
         JSON response with video information
     """
+    from app.services.video_service import VideoService
+    
     try:
         # Construct YouTube URL from video ID
         url = f"https://www.youtube.com/watch?v={video_id}"
@@ -194,20 +337,55 @@ def get_video_info(video_id):
         if not VideoService.validate_youtube_url(url):
             return jsonify({'error': 'Invalid video ID'}), 400
         
+        # Check cache first
+        cache_key = f"vinfo:{video_id}"
+        payload = _get_cached_video_info(cache_key)
+        if payload is not None:
+            return jsonify(payload)
+        
         # Get video info
         video_info = VideoService.get_video_info_only(url)
         
-        return jsonify({
+        payload = {
             'video_id': video_id,
             'video_info': video_info,
             'url': url
-        })
+        }
+        
+        if 'error' in video_info or video_info.get('title') == 'Unknown Title':
+            # Fall back to the last known information for this video
+            last_known = _get_cached_video_info(f"{cache_key}:last")
+            if last_known is not None:
+                return jsonify(last_known)
+        else:
+            _store_cached_video_info(cache_key, payload)
+        
+        return jsonify(payload)
         
     except Exception as e:
         current_app.logger.error(f"Error getting video info: {str(e)}")
         return jsonify({'error': 'Failed to get video information'}), 500
 
 
+def _get_cached_video_info(key):
+    """Read cached video information, treating cache backend errors as a miss."""
+    try:
+        return response_cache.get(key)
+    except Exception as e:
+        current_app.logger.warning(f"Video info cache read failed: {str(e)}")
+        return None
+
+
+def _store_cached_video_info(key, payload):
+    """Cache video information and keep it as the last known copy, ignoring cache backend errors."""
+    try:
+        response_cache.set(key, payload,
+                           timeout=current_app.config.get('VIDEO_INFO_CACHE_SECONDS', 1800))
+        response_cache.set(f"{key}:last", payload)
+    except Exception as e:
+        current_app.logger.warning(f"Video info cache write failed: {str(e)}")
+
+
 @api_v1_bp.route('/cache/stats', methods=['GET'])
 def get_cache_stats():
     """
@@ -223,7 +401,7 @@ def get_cache_stats():
                 'message': 'Caching is disabled'
             })
         
-        stats = cache_service.get_cache_stats()
+        stats = get_cache_service().get_cache_stats()
         
         return jsonify({
             'cache_enabled': True,
@@ -238,11 +416,12 @@ def get_cache_stats():
 @api_v1_bp.route('/cache/clear', methods=['POST'])
 def clear_cache():
     """
-    Clear cache (all entries or expired only).
+    Clear cache (all entries, expired only, or a single URL).
     
     Request Body:
         {
-            "clear_all": false  # optional, default false (clear expired only)
+            "clear_all": false,  # optional, default false (clear expired only)
+            "url": "..."         # optional, clear only this video's entries
         }
     
     Returns:
@@ -255,14 +434,23 @@ def clear_cache():
                 'message': 'Caching is disabled'
             }), 400
         
-        data = request.get_json() or {}
+        try:
+            data = load_request_json() or {}
+        except ValueError:
+            return jsonify({'error': 'Request body must be valid JSON'}), 400
         clear_all = data.get('clear_all', False)
+        url = data.get('url')
         
-        if clear_all:
-            removed_count = cache_service.clear_all_cache()
+        if url:
+            delete_cached_responses(summary_cache_key_for(SUMMARIZE_ENDPOINT, url))
+            removed_count = int(get_cache_service().delete_cached_summary(url))
+            message = f"Cleared cache entries for URL ({removed_count} removed)"
+        elif clear_all:
+            response_cache.clear()
+            removed_count = get_cache_service().clear_all_cache()
             message = f"Cleared all cache entries ({removed_count} removed)"
         else:
-            removed_count = cache_service.clear_expired_cache()
+            removed_count = get_cache_service().clear_expired_cache()
             message = f"Cleared expired cache entries ({removed_count} removed)"
         
         return jsonify({
@@ -276,10 +464,44 @@ def clear_cache():
         return jsonify({'error': 'Failed to clear cache'}), 500
 
 
+def _summarize_batch_item(app, url, options):
+    """
+    Summarize one URL of a batch request inside its own app context.
+    
+    Args:
+        app: Flask application instance
+        url: YouTube URL to summarize
+        options: Request options shared by all batch items
+    
+    Returns:
+        dict: Batch item result with the URL, status code and result data
+    """
+    from app.models.summary import SummaryRequest
+    
+    with app.app_context():
+        start_time = time.time()
+        try:
+            summary_request = SummaryRequest.from_dict({**options, 'url': url})
+        except ValueError as e:
+            return {'url': url, 'status_code': 400, 'result': {'error': str(e)}}
+        
+        try:
+            payload, status_code, _ = _summarize(summary_request, start_time)
+        except Exception as e:
+            app.logger.error(f"Unexpected error in batch item: {str(e)}")
+            return {'url': url, 'status_code': 500, 'result': {'error': 'Internal server error'}}
+        
+        return {'url': url, 'status_code': status_code, 'result': payload}
+
+
 @api_v1_bp.route('/batch/summarize', methods=['POST'])
 def batch_summarize():
     """
-    Batch summarize multiple videos (future feature).
+    Batch summarize multiple videos.
+    
+    Videos are processed concurrently, up to ``max_concurrent`` at a time,
+    through the same cache and service path as ``/summarize``. Duplicate
+    URLs within a batch are only processed once.
     
     Request Body:
         {
@@ -289,13 +511,62 @@ def batch_summarize():
         }
     
     Returns:
-        JSON response with batch operation status
+        JSON response with one result per requested URL
     """
-    return jsonify({
-        'error': 'Batch summarization is not yet implemented',
-        'message': 'This feature is planned for a future release',
-        'status': 'not_implemented'
-    }), 501
+    try:
+        if not request.is_json:
+            return jsonify({'error': 'Content-Type must be application/json'}), 400
+        
+        try:
+            data = load_request_json()
+        except ValueError:
+            return jsonify({'error': 'Request body must be valid JSON'}), 400
+        if not data:
+            return jsonify({'error': 'Request body is required'}), 400
+        
+        urls = data.get('urls')
+        max_urls = current_app.config.get('BATCH_MAX_URLS', 20)
+        if not isinstance(urls, list) or not urls or not all(isinstance(url, str) for url in urls):
+            return jsonify({'error': 'urls must be a non-empty list of URLs'}), 400
+        if len(urls) > max_urls:
+            return jsonify({'error': f'A batch may contain at most {max_urls} URLs'}), 400
+        
+        try:
+            max_concurrent = int(data.get('max_concurrent', 3))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'max_concurrent must be an integer'}), 400
+        max_concurrent = max(1, min(max_concurrent, current_app.config.get('BATCH_MAX_CONCURRENT', 5)))
+        
+        options = {}
+        if 'summary_type' in data:
+            options['summary_type'] = data['summary_type']
+        
+        app = current_app._get_current_object()
+        unique_urls = list(dict.fromkeys(urls))
+        results = {}
+        
+        with ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix='batch-summarize') as executor:
+            futures = {
+                executor.submit(_summarize_batch_item, app, url, options): url
+                for url in unique_urls
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        items = [results[url] for url in urls]
+        succeeded = sum(1 for item in items if item['status_code'] == 200)
+        
+        return json_response({
+            'status': 'completed',
+            'total': len(items),
+            'succeeded': succeeded,
+            'failed': len(items) - succeeded,
+            'results': items
+        })
+        
+    except Exception as e:
+        current_app.logger.error(f"Unexpected error in batch_summarize: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
 
 
 # Error handlers for API v1
@@ -0,0 +1,113 @@
+# app/extensions.py
+
+"""
+Flask extensions for YouTube Summarizer.
+
+Extensions are created here without an application and bound to it
+inside the application factory, so modules can import them freely.
+"""
+
+import hashlib
+import orjson
+from flask import current_app
+from flask_caching import Cache
+
+
+# Cache of serialized summarize response bodies, keyed by endpoint and video URL
+# and holding one body per set of response-shaping request options
+response_cache = Cache()
+
+
+def get_cache_service():
+    """Return the application's shared summary CacheService."""
+    return current_app.extensions['cache_service']
+
+
+def summary_cache_key_for(endpoint, url):
+    """
+    Build the response cache key for a summarize endpoint and URL.
+
+    All stored variants of a URL's response share this key, so one delete
+    invalidates every one of them.
+
+    Args:
+        endpoint (str): Endpoint name of the summarize view
+        url (str): YouTube URL being summarized
+
+    Returns:
+        str: Response cache key
+    """
+    url_hash = hashlib.sha1((url or '').strip().encode('utf-8')).hexdigest()
+    return f"{endpoint}:{url_hash}"
+
+
+def summary_cache_variant(options):
+    """
+    Digest the request options that shape a summarize response.
+
+    Args:
+        options (dict): JSON-serializable response-shaping options
+
+    Returns:
+        str: Variant identifier within a URL's response cache entry
+    """
+    return hashlib.sha1(orjson.dumps(options, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def get_cached_response(key, variant):
+    """
+    Read a stored response body for one request variant.
+
+    Cache backend errors are logged and treated as a miss.
+
+    Args:
+        key (str): Key from :func:`summary_cache_key_for`
+        variant (str): Variant from :func:`summary_cache_variant`
+
+    Returns:
+        Optional[bytes]: Serialized response body, or None
+    """
+    try:
+        variants = response_cache.get(key)
+    except Exception as e:
+        current_app.logger.warning(f"Response cache read failed: {str(e)}")
+        return None
+    return variants.get(variant) if isinstance(variants, dict) else None
+
+
+def store_cached_response(key, variant, body, timeout=None):
+    """
+    Store a response body for one request variant.
+
+    Cache backend errors are logged and ignored.
+
+    Args:
+        key (str): Key from :func:`summary_cache_key_for`
+        variant (str): Variant from :func:`summary_cache_variant`
+        body (bytes): Serialized response body
+        timeout (Optional[int]): Lifetime in seconds, the cache default if None
+    """
+    try:
+        variants = response_cache.get(key)
+        variants = dict(variants) if isinstance(variants, dict) else {}
+        variants[variant] = body
+        response_cache.set(key, variants, timeout=timeout)
+    except Exception as e:
+        current_app.logger.warning(f"Response cache write failed: {str(e)}")
+
+
+def delete_cached_responses(*keys):
+    """
+    Drop every stored variant for the given response cache keys.
+
+    Cache backend errors are logged and ignored.
+
+    Args:
+        *keys (str): Keys from :func:`summary_cache_key_for`
+    """
+    if not keys:
+        return
+    try:
+        response_cache.delete_many(*keys)
+    except Exception as e:
+        current_app.logger.warning(f"Response cache delete failed: {str(e)}")
@@ -0,0 +1,93 @@
+# app/json_provider.py
+
+"""
+JSON serialization for YouTube Summarizer.
+
+Responses and request bodies are encoded/decoded with orjson, which is
+considerably faster than the standard library for summary-sized payloads.
+"""
+
+import orjson
+from flask import Response, g, request
+from flask.json.provider import DefaultJSONProvider
+
+
+# Options shared by every orjson encode in the application
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    # Matches JSON_SORT_KEYS = False in the base configuration
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as a JSON string."""
+        option = ORJSON_OPTIONS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response directly, bypassing Flask's jsonify machinery.
+
+    Args:
+        payload: JSON-serializable object
+        status (int): HTTP status code
+
+    Returns:
+        Response: JSON response
+    """
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), status=status, mimetype='application/json')
+
+
+def json_prefix(payload, field):
+    """
+    Serialize a static object once, leaving it open for one string field.
+
+    Appending the field's value and ``'"}'`` completes the document, so
+    endpoints with a single dynamic string skip per-request encoding.
+
+    Args:
+        payload (dict): Non-empty static part of the object
+        field (str): Name of the trailing string field
+
+    Returns:
+        bytes: Serialized prefix ending with the field's opening quote
+    """
+    return orjson.dumps(payload, option=ORJSON_OPTIONS)[:-1] + b',"' + field.encode('utf-8') + b'":"'
+
+
+def load_request_json():
+    """
+    Decode the current request's JSON body with orjson.
+
+    The raw body is read without being kept on the request, and the decoded
+    value is memoized for the rest of the request so cache-key functions and
+    views can both call this without parsing twice.
+
+    Returns:
+        The decoded body, or None when the request has no body
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if 'request_json' not in g:
+        data = request.get_data(cache=False)
+        try:
+            g.request_json = orjson.loads(data) if data else None
+        except orjson.JSONDecodeError as e:
+            g.request_json = e
+
+    if isinstance(g.request_json, orjson.JSONDecodeError):
+        raise ValueError(f"Invalid JSON body: {g.request_json}")
+    return g.request_json
@@ -0,0 +1,139 @@
+# app/logging_handlers.py
+
+"""
+Logging handlers for YouTube Summarizer.
+
+Log records are handed to a queue on the request thread and written to
+disk by a background listener, so logging never blocks a request on I/O.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+
+
+class TimedMemoryHandler(MemoryHandler):
+    """
+    Buffer records and flush them to the target handler in batches.
+
+    The buffer is flushed when it holds ``capacity`` records, when a record
+    at ``flush_level`` or above arrives, or when a record arrives
+    ``flush_interval`` seconds after the last flush. :func:`attach_queue_handler`
+    also flushes it on a timer, so records never wait on an idle logger.
+    """
+
+    def __init__(self, capacity, flush_interval, target, flush_level=logging.ERROR):
+        super().__init__(capacity, flushLevel=flush_level, target=target)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+
+    def shouldFlush(self, record):
+        """Check whether the buffer should be written out."""
+        return (super().shouldFlush(record) or
+                time.monotonic() - self._last_flush >= self.flush_interval)
+
+    def flush(self):
+        """Write buffered records to the target handler."""
+        super().flush()
+        self._last_flush = time.monotonic()
+
+
+class CountingRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that tracks the file size in memory.
+
+    The base class checks the stream position for every record; here the
+    bytes written are counted and the real check only runs once the count
+    reaches ``maxBytes``. Characters are counted, so multi-byte text can
+    make the file slightly larger than ``maxBytes`` before it rotates.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        self._record_size = 0
+
+    def shouldRollover(self, record):
+        """Check whether writing the record would exceed ``maxBytes``."""
+        if self.maxBytes <= 0:
+            return False
+        record_size = self._record_size = len(self.format(record)) + len(self.terminator)
+        self._bytes_written += record_size
+        if self._bytes_written < self.maxBytes:
+            return False
+        if super().shouldRollover(record):
+            return True
+        # The count ran ahead of the file (e.g. it was truncated); resync it
+        self._bytes_written = (self.stream.tell() if self.stream else 0) + record_size
+        return False
+
+    def doRollover(self):
+        """Rotate the files; the new file starts with the record being emitted."""
+        super().doRollover()
+        self._bytes_written = self._record_size
+
+
+def attach_queue_handler(logger, target, capacity=100, flush_interval=1.0, flush_level=logging.ERROR):
+    """
+    Route a logger's records through a queue to a buffered target handler.
+
+    Args:
+        logger (logging.Logger): Logger to attach the queue handler to
+        target (logging.Handler): Handler that performs the actual writes
+        capacity (int): Number of records buffered before a flush
+        flush_interval (float): Maximum seconds between flushes
+        flush_level (int): Records at this level or above are written immediately
+
+    Returns:
+        QueueListener: The started listener, stopped automatically at exit
+    """
+    log_queue = queue.Queue(-1)
+    buffer_handler = TimedMemoryHandler(capacity, flush_interval, target, flush_level=flush_level)
+    buffer_handler.setLevel(target.level)
+
+    listener = QueueListener(log_queue, buffer_handler, respect_handler_level=True)
+    listener.start()
+
+    # Flush every interval even when no records arrive to trigger it
+    stop_flushing = threading.Event()
+
+    def _flush_periodically():
+        while not stop_flushing.wait(flush_interval):
+            buffer_handler.flush()
+
+    threading.Thread(target=_flush_periodically, name='log-flush', daemon=True).start()
+
+    logger.addHandler(QueueHandler(log_queue))
+
+    def _shutdown():
+        stop_flushing.set()
+        listener.stop()
+        buffer_handler.close()
+        target.close()
+
+    atexit.register(_shutdown)
+    return listener
+
+
+def exit_on_sigterm():
+    """
+    Turn SIGTERM into a normal interpreter exit so atexit hooks flush buffered logs.
+
+    Only installed from the main thread and when no other SIGTERM handler
+    (e.g. the WSGI server's) is already in place.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is not signal.SIG_DFL:
+        return
+
+    def _handle_sigterm(signum, frame):
+        sys.exit(128 + signum)
+
+    signal.signal(signal.SIGTERM, _handle_sigterm)
@@ -1,18 +1,16 @@
 # app/routes.py
 
-from flask import render_template, request, jsonify, current_app
+from flask import render_template, request, jsonify, current_app, Response
 from datetime import datetime
 import time
 
 from app import app
-from app.services.video_service import VideoService
-from app.services.summary_service import SummaryService
-from app.services.cache_service import CacheService
-from app.models.summary import SummaryRequest, SummaryResponse, SummaryStatus, SummaryType
-from app.models.video import Video, VideoInfo
+from app.extensions import get_cache_service
+from app.json_provider import json_prefix, load_request_json
+from app.utils.timestamps import utc_now_iso
 
-# Initialize services
-cache_service = CacheService()
+# Health response up to its timestamp, which is the only per-request value
+_HEALTH_PREFIX = json_prefix({'status': 'healthy', 'version': '1.0.0'}, 'timestamp')
 
 
 @app.route('/')
@@ -28,15 +26,24 @@ def summarize():
     Main summarization endpoint.
 
     Handles video summarization requests from the web interface.
+    Summaries are cached only in the CacheService, which the summary
+    page also reads, so there is a single entry to expire or clear.
     """
     start_time = time.time()
 
+    # Imported here so the NLP stack is only loaded once a summary is requested
+    from app.services.video_service import VideoService
+    from app.services.summary_service import SummaryService
+
     try:
         # Validate request
         if not request.is_json:
             return jsonify({'error': 'Content-Type must be application/json'}), 400
 
-        data = request.get_json()
+        try:
+            data = load_request_json()
+        except ValueError:
+            return jsonify({'error': 'Request body must be valid JSON'}), 400
         if not data:
             return jsonify({'error': 'Request body is required'}), 400
 
@@ -50,8 +57,8 @@ def summarize():
 
         # Check cache first
         if current_app.config.get('CACHE_ENABLED', True):
-            cached_result = cache_service.get_cached_summary(url)
-            if cached_result:
+            cached_result = get_cache_service().get_cached_summary(url)
+            if cached_result and not cached_result['stale']:
                 current_app.logger.info(f"Returning cached result for URL: {url}")
                 return jsonify({
                     'summary': cached_result['summary'].content if hasattr(cached_result['summary'], 'content') else cached_result['summary'],
@@ -70,7 +77,7 @@ def summarize():
 
         # Generate summary using the service
         try:
-            summary_text, keywords = SummaryService.generate_summary(transcript, video_info)
+            summary_text, keywords = SummaryService.generate_summary_shared(transcript, video_info, key=url)
             current_app.logger.info(f"Generated summary for: {video_info.get('title', 'Unknown')}")
         except Exception as e:
             current_app.logger.error(f"Failed to generate summary: {str(e)}")
@@ -81,7 +88,7 @@ def summarize():
         # Cache the result
         if current_app.config.get('CACHE_ENABLED', True):
             try:
-                cache_service.cache_summary(url, summary_text, keywords, video_info)
+                get_cache_service().cache_summary(url, summary_text, keywords, video_info)
                 current_app.logger.info(f"Cached summary for: {video_info.get('title', 'Unknown')}")
             except Exception as e:
                 current_app.logger.warning(f"Failed to cache summary: {str(e)}")
@@ -119,7 +126,7 @@ def view_summary(video_id):
 
         # Check if we have a cached summary
         if current_app.config.get('CACHE_ENABLED', True):
-            cached_result = cache_service.get_cached_summary(url)
+            cached_result = get_cache_service().get_cached_summary(url)
             if cached_result:
                 return render_template('summary.html',
                                      summary=cached_result['summary'],
@@ -141,11 +148,7 @@ def view_summary(video_id):
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
-        'version': '1.0.0'
-    })
+    return Response(_HEALTH_PREFIX + utc_now_iso().encode('ascii') + b'"}', mimetype='application/json')
 
 
 @app.route('/cache/stats')
@@ -155,7 +158,7 @@ def cache_stats():
         return jsonify({'cache_enabled': False})
 
     try:
-        stats = cache_service.get_cache_stats()
+        stats = get_cache_service().get_cache_stats()
         return jsonify({
             'cache_enabled': True,
             'stats': stats
@@ -7,7 +7,25 @@ This package contains business logic services that orchestrate
 the various utilities and provide a clean interface for the routes.
 """
 
-from .video_service import VideoService
-from .summary_service import SummaryService
+import importlib
 
-__all__ = ['VideoService', 'SummaryService']
+from .cache_service import CacheService
+
+# Services backed by the NLP/download stack are loaded on first access
+_LAZY_SERVICES = {
+    'VideoService': '.video_service',
+    'SummaryService': '.summary_service',
+}
+
+
+def __getattr__(name):
+    """Import heavy services lazily on ``from app.services import ...``."""
+    if name in _LAZY_SERVICES:
+        module = importlib.import_module(_LAZY_SERVICES[name], __name__)
+        service = getattr(module, name)
+        globals()[name] = service
+        return service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['VideoService', 'SummaryService', 'CacheService']
@@ -1,27 +1,106 @@
 # app/services/cache_service.py
 
 import hashlib
-import json
+import mmap
 import os
+import threading
 import time
-from typing import Optional, Dict, Any
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, Tuple
 from datetime import datetime, timedelta
 
+import orjson
+
+
+@lru_cache(maxsize=4096)
+def _hash_url(url: str) -> str:
+    """Hash a URL into a cache key; memoized as each request hashes its URL several times."""
+    return hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+
 
 class CacheService:
     """Service for caching summaries and video data to improve performance."""
     
-    def __init__(self, cache_dir: str = "cache", cache_duration_hours: int = 24):
+    # Prefix for summary entries stored in Redis
+    REDIS_KEY_PREFIX = "sum:"
+    
+    # Prefixes for per-URL locks stored in Redis: one for background refreshes
+    # of stale entries and one for computing missing entries, so they never
+    # block each other
+    REDIS_REFRESH_LOCK_PREFIX = "lock:refresh:"
+    REDIS_COMPUTE_LOCK_PREFIX = "lock:sum:"
+    REFRESH_LOCK_SECONDS = 60
+    COMPUTE_LOCK_SECONDS = 120
+    
+    # Deletes a lock only if it still holds the caller's token
+    RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+    
+    # Key and lifetime of the cached statistics snapshot in Redis
+    REDIS_STATS_KEY = "cache_stats:summaries"
+    STATS_TTL_SECONDS = 60
+    
+    # Keys scanned and unlinked per pipeline round trip when clearing
+    CLEAR_BATCH_SIZE = 500
+    
+    # Parsed file-cache entries kept in memory, and how long one is trusted
+    # before the file is read again (another worker may have replaced it)
+    MEMORY_CACHE_SIZE = 512
+    MEMORY_CACHE_SECONDS = 60
+    
+    # Cache files larger than this are memory-mapped instead of read
+    MMAP_THRESHOLD_BYTES = 16384
+    
+    # Directory size from which cache files are stat'ed in parallel
+    STATS_PARALLEL_MIN_ENTRIES = 64
+    
+    def __init__(self, cache_dir: str = "cache", cache_duration_hours: int = 24,
+                 redis_client=None, stale_hours: int = 0):
         """
         Initialize cache service.
         
         Args:
             cache_dir (str): Directory to store cache files
-            cache_duration_hours (int): How long to keep cache entries (in hours)
+            cache_duration_hours (int): How long cache entries stay fresh (in hours)
+            redis_client: Optional Redis client; when given, entries are stored
+                in Redis instead of on disk
+            stale_hours (int): How long entries are kept after going stale so
+                they can be served while being refreshed (in hours)
         """
         self.cache_dir = cache_dir
         self.cache_duration = timedelta(hours=cache_duration_hours)
-        self._ensure_cache_dir()
+        self.stale_duration = timedelta(hours=stale_hours)
+        self.redis = redis_client
+        self._lock_mutex = threading.Lock()
+        self._held_locks = {}
+        self._memory_cache = OrderedDict()
+        self._memory_lock = threading.Lock()
+        if self.redis is None:
+            self._ensure_cache_dir()
+    
+    def init_app(self, app):
+        """
+        Configure the cache service from a Flask application.
+        
+        Uses the Redis client registered in ``app.extensions['redis']`` when
+        the Redis backend is enabled, otherwise the file cache in ``CACHE_DIR``.
+        
+        Args:
+            app: Flask application instance
+        """
+        self.cache_dir = app.config.get('CACHE_DIR', self.cache_dir)
+        self.cache_duration = timedelta(hours=app.config.get('CACHE_DURATION_HOURS', 24))
+        self.stale_duration = timedelta(hours=app.config.get('CACHE_STALE_HOURS', 0))
+        self.redis = app.extensions.get('redis')
+        if self.redis is None:
+            self._ensure_cache_dir()
     
     def _ensure_cache_dir(self):
         """Ensure cache directory exists."""
@@ -38,7 +117,101 @@ class CacheService:
         Returns:
             str: Cache key (hash of URL)
         """
-        return hashlib.md5(url.encode()).hexdigest()
+        return _hash_url(url)
+    
+    def _memory_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a parsed cache entry from the in-memory tier.
+        
+        Args:
+            cache_key (str): Cache key
+            
+        Returns:
+            Optional[Dict[str, Any]]: Cache entry data, None if missing or expired
+        """
+        with self._memory_lock:
+            item = self._memory_cache.get(cache_key)
+            if item is None:
+                return None
+            
+            expires_at, cache_data = item
+            if time.monotonic() >= expires_at:
+                del self._memory_cache[cache_key]
+                return None
+            
+            self._memory_cache.move_to_end(cache_key)
+            return cache_data
+    
+    def _memory_put(self, cache_key: str, cache_data: Dict[str, Any]) -> None:
+        """
+        Store a parsed cache entry in the in-memory tier, evicting the least recently used.
+        
+        Args:
+            cache_key (str): Cache key
+            cache_data (Dict[str, Any]): Cache entry data
+        """
+        with self._memory_lock:
+            self._memory_cache[cache_key] = (time.monotonic() + self.MEMORY_CACHE_SECONDS, cache_data)
+            self._memory_cache.move_to_end(cache_key)
+            while len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _memory_discard(self, cache_key: Optional[str] = None) -> None:
+        """
+        Remove an entry from the in-memory tier.
+        
+        Args:
+            cache_key (Optional[str]): Cache key, or None to remove all entries
+        """
+        with self._memory_lock:
+            if cache_key is None:
+                self._memory_cache.clear()
+            else:
+                self._memory_cache.pop(cache_key, None)
+    
+    def _read_cache_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Read and parse a cache file.
+        
+        Large files are parsed straight from a read-only memory map, so
+        entries already in the page cache are not copied into a buffer first.
+        
+        Args:
+            file_path (str): Path of the cache file
+            
+        Returns:
+            Dict[str, Any]: Cache entry data
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= self.MMAP_THRESHOLD_BYTES:
+                return orjson.loads(f.read())
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    
+    def _write_cache_file(self, file_path: str, data: bytes) -> None:
+        """
+        Atomically write a cache file.
+        
+        The data is written in one call to a temporary file unique to this
+        thread, then renamed over the target, so readers and concurrent
+        writers never see a partially written entry.
+        
+        Args:
+            file_path (str): Path of the cache file
+            data (bytes): Serialized cache entry
+        """
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb', buffering=0) as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def _get_cache_file_path(self, cache_key: str) -> str:
         """
@@ -52,22 +225,140 @@ class CacheService:
         """
         return os.path.join(self.cache_dir, f"{cache_key}.json")
     
-    def _is_cache_valid(self, cache_data: Dict[str, Any]) -> bool:
+    def _get_redis_key(self, url: str) -> str:
         """
-        Check if cache entry is still valid.
+        Get the Redis key for a YouTube URL.
+        
+        Args:
+            url (str): YouTube URL
+            
+        Returns:
+            str: Redis key for cache entry
+        """
+        return f"{self.REDIS_KEY_PREFIX}{self._get_cache_key(url)}"
+    
+    def _get_lock_key(self, prefix: str, url: str) -> str:
+        """
+        Get the Redis lock key for a YouTube URL.
+        
+        Args:
+            prefix (str): Lock key prefix
+            url (str): YouTube URL
+            
+        Returns:
+            str: Redis key for the lock
+        """
+        return f"{prefix}{self._get_cache_key(url)}"
+    
+    @property
+    def _ttl_seconds(self) -> int:
+        """Cache entry lifetime in whole seconds, including the stale window."""
+        return int((self.cache_duration + self.stale_duration).total_seconds())
+    
+    def _get_cache_age(self, cache_data: Dict[str, Any]) -> Optional[float]:
+        """
+        Get the age of a cache entry.
         
         Args:
             cache_data (Dict[str, Any]): Cache entry data
             
         Returns:
-            bool: True if cache is valid, False otherwise
+            Optional[float]: Age of the entry in seconds, None if the timestamp is unusable
         """
+        cached_ts = cache_data.get('ts')
+        if isinstance(cached_ts, (int, float)):
+            return time.time() - cached_ts
+        
+        # Entries written before epoch timestamps were stored
         try:
             cached_time = datetime.fromisoformat(cache_data.get('timestamp', ''))
-            return datetime.now() - cached_time < self.cache_duration
+            return (datetime.now() - cached_time).total_seconds()
         except (ValueError, TypeError):
+            return None
+    
+    def _is_cache_valid(self, cache_data: Dict[str, Any]) -> bool:
+        """
+        Check if cache entry is still valid (fresh or within the stale window).
+        
+        Args:
+            cache_data (Dict[str, Any]): Cache entry data
+            
+        Returns:
+            bool: True if cache is valid, False otherwise
+        """
+        age = self._get_cache_age(cache_data)
+        return age is not None and age < self._ttl_seconds
+    
+    def _is_cache_file_valid(self, entry: os.DirEntry) -> bool:
+        """
+        Check if a cache file is still valid without opening it.
+        
+        Entries are written in one go, so the file's modification time is
+        the time the entry was cached.
+        
+        Args:
+            entry (os.DirEntry): Directory entry of the cache file
+            
+        Returns:
+            bool: True if cache is valid, False otherwise
+        """
+        try:
+            return time.time() - entry.stat().st_mtime < self._ttl_seconds
+        except OSError:
             return False
     
+    def _stat_cache_file(self, entry: os.DirEntry) -> Tuple[int, bool]:
+        """
+        Get the size and validity of a cache file with a single stat.
+        
+        Args:
+            entry (os.DirEntry): Directory entry of the cache file
+            
+        Returns:
+            Tuple[int, bool]: File size in bytes and whether the entry is valid
+        """
+        try:
+            stat = entry.stat()
+        except OSError:
+            return 0, False
+        return stat.st_size, time.time() - stat.st_mtime < self._ttl_seconds
+    
+    def _get_fresh_seconds(self, cache_data: Dict[str, Any]) -> float:
+        """
+        Get how long a cache entry stays fresh.
+        
+        Args:
+            cache_data (Dict[str, Any]): Cache entry data
+            
+        Returns:
+            float: Seconds left in the fresh window, 0 if stale or invalid
+        """
+        age = self._get_cache_age(cache_data)
+        if age is None:
+            return 0.0
+        return max(0.0, self.cache_duration.total_seconds() - age)
+    
+    def _build_cached_result(self, cache_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the public cache result from a stored cache entry.
+        
+        Args:
+            cache_data (Dict[str, Any]): Cache entry data
+            
+        Returns:
+            Dict[str, Any]: Cached summary data, including how many seconds
+                the entry stays fresh (``fresh_seconds``)
+        """
+        fresh_seconds = self._get_fresh_seconds(cache_data)
+        return {
+            'summary': cache_data.get('summary'),
+            'keywords': cache_data.get('keywords'),
+            'video_info': cache_data.get('video_info'),
+            'cached_at': cache_data.get('timestamp'),
+            'stale': fresh_seconds <= 0,
+            'fresh_seconds': fresh_seconds
+        }
+    
     def get_cached_summary(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get cached summary for a YouTube URL.
@@ -76,27 +367,32 @@ class CacheService:
             url (str): YouTube URL
             
         Returns:
-            Optional[Dict[str, Any]]: Cached data if available and valid, None otherwise
+            Optional[Dict[str, Any]]: Cached data if available and valid, None otherwise.
+                The ``stale`` flag is set for entries past their fresh window,
+                and ``fresh_seconds`` holds the time left in it.
         """
+        if self.redis is not None:
+            return self._get_cached_summary_redis(url)
+        
         try:
             cache_key = self._get_cache_key(url)
+            cache_data = self._memory_get(cache_key)
+            if cache_data is not None and self._is_cache_valid(cache_data):
+                return self._build_cached_result(cache_data)
+            
             cache_file = self._get_cache_file_path(cache_key)
             
             if not os.path.exists(cache_file):
                 return None
             
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = self._read_cache_file(cache_file)
             
             if self._is_cache_valid(cache_data):
-                return {
-                    'summary': cache_data.get('summary'),
-                    'keywords': cache_data.get('keywords'),
-                    'video_info': cache_data.get('video_info'),
-                    'cached_at': cache_data.get('timestamp')
-                }
+                self._memory_put(cache_key, cache_data)
+                return self._build_cached_result(cache_data)
             else:
                 # Remove expired cache
+                self._memory_discard(cache_key)
                 os.remove(cache_file)
                 return None
                 
@@ -117,27 +413,205 @@ class CacheService:
         Returns:
             bool: True if caching was successful, False otherwise
         """
+        if self.redis is not None:
+            return self._cache_summary_redis(url, summary, keywords, video_info)
+        
         try:
             cache_key = self._get_cache_key(url)
             cache_file = self._get_cache_file_path(cache_key)
             
+            now = time.time()
             cache_data = {
                 'url': url,
                 'summary': summary,
                 'keywords': keywords,
                 'video_info': video_info,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': datetime.fromtimestamp(now).isoformat(),
+                'ts': now
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            self._write_cache_file(cache_file, orjson.dumps(cache_data))
             
+            self._memory_put(cache_key, cache_data)
             return True
             
         except Exception as e:
             print(f"Error caching summary: {e}")
             return False
     
+    def _acquire_lock(self, prefix: str, url: str, timeout: int) -> Optional[str]:
+        """
+        Try to take a per-URL lock owned by this call.
+        
+        Uses ``SET NX`` with a timeout in Redis, storing a token unique to
+        this call, or an in-process map for the file backend.
+        
+        Args:
+            prefix (str): Lock key prefix, one per kind of lock
+            url (str): YouTube URL
+            timeout (int): Lock expiry in seconds for Redis
+            
+        Returns:
+            Optional[str]: Token identifying the owner, None if the lock is held
+        """
+        token = f"{os.getpid()}:{uuid.uuid4().hex}"
+        if self.redis is not None:
+            try:
+                if self.redis.set(self._get_lock_key(prefix, url), token, nx=True, ex=timeout):
+                    return token
+                return None
+            except Exception as e:
+                print(f"Error acquiring lock: {e}")
+                return None
+        
+        with self._lock_mutex:
+            if (prefix, url) in self._held_locks:
+                return None
+            self._held_locks[(prefix, url)] = token
+            return token
+    
+    def _release_lock(self, prefix: str, url: str, token: str) -> None:
+        """
+        Release a lock taken with :meth:`_acquire_lock`, if still owned by ``token``.
+        
+        In Redis the check and delete run as one script, so a lock that
+        expired and was taken by another worker is left alone.
+        
+        Args:
+            prefix (str): Lock key prefix
+            url (str): YouTube URL
+            token (str): Token returned when the lock was acquired
+        """
+        if self.redis is not None:
+            try:
+                self.redis.eval(self.RELEASE_LOCK_SCRIPT, 1, self._get_lock_key(prefix, url), token)
+            except Exception as e:
+                print(f"Error releasing lock: {e}")
+            return
+        
+        with self._lock_mutex:
+            if self._held_locks.get((prefix, url)) == token:
+                del self._held_locks[(prefix, url)]
+    
+    def _is_locked(self, prefix: str, url: str) -> bool:
+        """
+        Check whether a lock is currently held for a URL.
+        
+        Args:
+            prefix (str): Lock key prefix
+            url (str): YouTube URL
+            
+        Returns:
+            bool: True if a worker holds the lock
+        """
+        if self.redis is not None:
+            try:
+                return bool(self.redis.exists(self._get_lock_key(prefix, url)))
+            except Exception:
+                return False
+        
+        with self._lock_mutex:
+            return (prefix, url) in self._held_locks
+    
+    def acquire_refresh_lock(self, url: str, timeout: Optional[int] = None) -> Optional[str]:
+        """
+        Try to become the single refresher of a URL's stale cache entry.
+        
+        Args:
+            url (str): YouTube URL
+            timeout (Optional[int]): Lock expiry in seconds for Redis
+                (defaults to ``REFRESH_LOCK_SECONDS``)
+            
+        Returns:
+            Optional[str]: Token to release the lock with, None if a refresh is in progress
+        """
+        return self._acquire_lock(self.REDIS_REFRESH_LOCK_PREFIX, url, timeout or self.REFRESH_LOCK_SECONDS)
+    
+    def release_refresh_lock(self, url: str, token: str) -> None:
+        """
+        Release a refresh lock taken with :meth:`acquire_refresh_lock`.
+        
+        Args:
+            url (str): YouTube URL
+            token (str): Token returned by :meth:`acquire_refresh_lock`
+        """
+        self._release_lock(self.REDIS_REFRESH_LOCK_PREFIX, url, token)
+    
+    def coalesced_get_or_compute(self, url: str, compute_fn: Callable[[], Any],
+                                 wait_timeout: Optional[float] = None) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Get the cached summary for a URL, computing it at most once across workers.
+        
+        On a miss, the worker that acquires the URL's lock runs ``compute_fn``,
+        which is expected to cache its result. Concurrent callers poll the cache
+        with exponential backoff until the entry appears instead of repeating
+        the work. If the lock holder gives up or the wait times out, the caller
+        computes the result itself.
+        
+        Args:
+            url (str): YouTube URL
+            compute_fn (Callable[[], Any]): Produces (and caches) the result on a miss
+            wait_timeout (Optional[float]): Maximum seconds to wait for another
+                worker (defaults to ``COMPUTE_LOCK_SECONDS``)
+            
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Any]: ``(cached_result, None)`` when
+                served from the cache, ``(None, compute_fn())`` otherwise
+        """
+        cached_result = self.get_cached_summary(url)
+        if cached_result:
+            return cached_result, None
+        
+        token = self._acquire_lock(self.REDIS_COMPUTE_LOCK_PREFIX, url, self.COMPUTE_LOCK_SECONDS)
+        if token is not None:
+            try:
+                return None, compute_fn()
+            finally:
+                self._release_lock(self.REDIS_COMPUTE_LOCK_PREFIX, url, token)
+        
+        deadline = time.monotonic() + (wait_timeout or self.COMPUTE_LOCK_SECONDS)
+        delay = 0.1
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+            
+            cached_result = self.get_cached_summary(url)
+            if cached_result:
+                return cached_result, None
+            
+            if not self._is_locked(self.REDIS_COMPUTE_LOCK_PREFIX, url):
+                break
+        
+        return None, compute_fn()
+    
+    def delete_cached_summary(self, url: str) -> bool:
+        """
+        Remove the cached summary for a YouTube URL.
+        
+        Args:
+            url (str): YouTube URL
+            
+        Returns:
+            bool: True if an entry was removed, False otherwise
+        """
+        try:
+            if self.redis is not None:
+                return bool(self.redis.delete(self._get_redis_key(url)))
+            
+            cache_key = self._get_cache_key(url)
+            self._memory_discard(cache_key)
+            
+            cache_file = self._get_cache_file_path(cache_key)
+            if not os.path.exists(cache_file):
+                return False
+            
+            os.remove(cache_file)
+            return True
+            
+        except Exception as e:
+            print(f"Error deleting cache entry: {e}")
+            return False
+    
     def clear_expired_cache(self) -> int:
         """
         Clear all expired cache entries.
@@ -145,28 +619,21 @@ class CacheService:
         Returns:
             int: Number of cache entries removed
         """
+        if self.redis is not None:
+            # Redis expires entries on its own via their TTL
+            return 0
+        
         removed_count = 0
         
         try:
-            if not os.path.exists(self.cache_dir):
-                return 0
-            
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            cache_data = json.load(f)
-                        
-                        if not self._is_cache_valid(cache_data):
-                            os.remove(file_path)
-                            removed_count += 1
-                            
-                    except Exception:
-                        # Remove corrupted cache files
-                        os.remove(file_path)
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and not self._is_cache_file_valid(entry):
+                        os.remove(entry.path)
                         removed_count += 1
                         
+        except FileNotFoundError:
+            return 0
         except Exception as e:
             print(f"Error clearing expired cache: {e}")
         
@@ -179,18 +646,21 @@ class CacheService:
         Returns:
             int: Number of cache entries removed
         """
+        if self.redis is not None:
+            return self._clear_all_cache_redis()
+        
+        self._memory_discard()
         removed_count = 0
         
         try:
-            if not os.path.exists(self.cache_dir):
-                return 0
-            
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    os.remove(file_path)
-                    removed_count += 1
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json'):
+                        os.remove(entry.path)
+                        removed_count += 1
                     
+        except FileNotFoundError:
+            return 0
         except Exception as e:
             print(f"Error clearing cache: {e}")
         
@@ -203,37 +673,24 @@ class CacheService:
         Returns:
             Dict[str, Any]: Cache statistics
         """
+        if self.redis is not None:
+            return self._get_cache_stats_redis()
+        
         try:
-            if not os.path.exists(self.cache_dir):
-                return {
-                    'total_entries': 0,
-                    'valid_entries': 0,
-                    'expired_entries': 0,
-                    'total_size_mb': 0
-                }
-            
-            total_entries = 0
-            valid_entries = 0
-            expired_entries = 0
-            total_size = 0
-            
-            for filename in os.listdir(self.cache_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(self.cache_dir, filename)
-                    total_entries += 1
-                    total_size += os.path.getsize(file_path)
-                    
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            cache_data = json.load(f)
-                        
-                        if self._is_cache_valid(cache_data):
-                            valid_entries += 1
-                        else:
-                            expired_entries += 1
-                            
-                    except Exception:
-                        expired_entries += 1
+            with os.scandir(self.cache_dir) as entries:
+                cache_files = [entry for entry in entries if entry.name.endswith('.json')]
+            
+            if len(cache_files) >= self.STATS_PARALLEL_MIN_ENTRIES:
+                # stat() releases the GIL, so a pool keeps slow or networked storage busy
+                with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                    file_stats = list(executor.map(self._stat_cache_file, cache_files))
+            else:
+                file_stats = [self._stat_cache_file(entry) for entry in cache_files]
+            
+            total_entries = len(file_stats)
+            valid_entries = sum(1 for _, is_valid in file_stats if is_valid)
+            expired_entries = total_entries - valid_entries
+            total_size = sum(size for size, _ in file_stats)
             
             return {
                 'total_entries': total_entries,
@@ -242,6 +699,103 @@ class CacheService:
                 'total_size_mb': round(total_size / (1024 * 1024), 2)
             }
             
+        except Exception as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Error getting cache stats: {e}")
+            return {
+                'total_entries': 0,
+                'valid_entries': 0,
+                'expired_entries': 0,
+                'total_size_mb': 0
+            }
+    
+    def _get_cached_summary_redis(self, url: str) -> Optional[Dict[str, Any]]:
+        """Redis implementation of :meth:`get_cached_summary`."""
+        try:
+            raw = self.redis.get(self._get_redis_key(url))
+            if raw is None:
+                return None
+            
+            return self._build_cached_result(orjson.loads(raw))
+            
+        except Exception as e:
+            print(f"Error reading cache: {e}")
+            return None
+    
+    def _cache_summary_redis(self, url: str, summary: str, keywords: str, video_info: Dict[str, str]) -> bool:
+        """Redis implementation of :meth:`cache_summary`."""
+        try:
+            now = time.time()
+            cache_data = {
+                'url': url,
+                'summary': summary,
+                'keywords': keywords,
+                'video_info': video_info,
+                'timestamp': datetime.fromtimestamp(now).isoformat(),
+                'ts': now
+            }
+            
+            self.redis.setex(
+                self._get_redis_key(url),
+                self._ttl_seconds,
+                orjson.dumps(cache_data)
+            )
+            return True
+            
+        except Exception as e:
+            print(f"Error caching summary: {e}")
+            return False
+    
+    def _clear_all_cache_redis(self) -> int:
+        """Redis implementation of :meth:`clear_all_cache`."""
+        removed_count = 0
+        
+        try:
+            # UNLINK frees memory in the background; batch it so a large
+            # cache never blocks other Redis commands
+            pipe = self.redis.pipeline(transaction=False)
+            pending = 0
+            for key in self.redis.scan_iter(match=f"{self.REDIS_KEY_PREFIX}*", count=self.CLEAR_BATCH_SIZE):
+                pipe.unlink(key)
+                pending += 1
+                if pending >= self.CLEAR_BATCH_SIZE:
+                    removed_count += sum(pipe.execute())
+                    pending = 0
+            pipe.unlink(self.REDIS_STATS_KEY)
+            removed_count += sum(pipe.execute()[:pending])
+            
+        except Exception as e:
+            print(f"Error clearing cache: {e}")
+        
+        return removed_count
+    
+    def _get_cache_stats_redis(self) -> Dict[str, Any]:
+        """
+        Redis implementation of :meth:`get_cache_stats`.
+        
+        Walking the keyspace is comparatively expensive, so the computed
+        statistics are kept in Redis for ``STATS_TTL_SECONDS``.
+        """
+        try:
+            cached_stats = self.redis.get(self.REDIS_STATS_KEY)
+            if cached_stats is not None:
+                return orjson.loads(cached_stats)
+            
+            keys = list(self.redis.scan_iter(match=f"{self.REDIS_KEY_PREFIX}*"))
+            pipe = self.redis.pipeline(transaction=False)
+            for key in keys:
+                pipe.strlen(key)
+            total_size = sum(pipe.execute()) if keys else 0
+            
+            stats = {
+                'total_entries': len(keys),
+                'valid_entries': len(keys),
+                'expired_entries': 0,
+                'total_size_mb': round(total_size / (1024 * 1024), 2)
+            }
+            self.redis.setex(self.REDIS_STATS_KEY, self.STATS_TTL_SECONDS, orjson.dumps(stats))
+            return stats
+            
         except Exception as e:
             print(f"Error getting cache stats: {e}")
             return {
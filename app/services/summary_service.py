@@ -1,16 +1,103 @@
 # app/services/summary_service.py
 
 from typing import Dict, Tuple, List, Optional
-from app.utils.summarizer import run_summarization
-from app.utils.keyword_extractor import extract_keywords
+from concurrent.futures import Future
+import threading
+from app.utils.summarizer import run_summarization, download_nltk_data, get_summarization_pipeline, get_stop_words
+from app.utils.keyword_extractor import extract_keywords, get_nlp
 from app.utils.advanced_summarizer import create_professional_summary
-import nltk
-from collections import defaultdict
+import re
+from bisect import bisect_left
+from collections import Counter
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; indicator matching falls back to per-indicator scans
+    ahocorasick = None
+
+
+# Keywords that indicate each content type
+CONTENT_INDICATORS = {
+    'tutorial': ['how to', 'tutorial', 'guide', 'step by step', 'learn', 'teach'],
+    'review': ['review', 'opinion', 'rating', 'recommend', 'pros and cons'],
+    'educational': ['explain', 'education', 'science', 'history', 'facts'],
+    'entertainment': ['funny', 'comedy', 'entertainment', 'fun', 'laugh'],
+    'news': ['news', 'breaking', 'report', 'update', 'current'],
+    'gaming': ['game', 'gaming', 'play', 'level', 'boss', 'strategy'],
+    'cooking': ['recipe', 'cook', 'ingredient', 'kitchen', 'food'],
+    'fitness': ['workout', 'exercise', 'fitness', 'training', 'muscle'],
+    'technology': ['tech', 'software', 'app', 'device', 'computer'],
+    'music': ['song', 'music', 'album', 'artist', 'lyrics']
+}
+
+
+# Words that suggest a sentence makes an important point
+IMPORTANCE_INDICATORS = [
+    'important', 'key', 'main', 'first', 'second', 'third',
+    'remember', 'note', 'tip', 'trick', 'secret', 'best',
+    'worst', 'never', 'always', 'must', 'should', 'need'
+]
+
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton from (word, value) pairs, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for word, value in words:
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+_CONTENT_AUTOMATON = _build_automaton(
+    (indicator, content_type)
+    for content_type, indicators in CONTENT_INDICATORS.items()
+    for indicator in indicators
+)
+_IMPORTANCE_AUTOMATON = _build_automaton((indicator, indicator) for indicator in IMPORTANCE_INDICATORS)
+
+_PERIOD_RE = re.compile(r'\.')
+_SENTENCE_RE = re.compile(r'[^.]+')
+
+# Lowercase alphanumeric words of three or more characters
+_WORD_RE = re.compile(r'[a-z0-9]{3,}')
+
+# Whitespace-separated tokens, counted without building a list of them
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words, matching ``len(text.split())``."""
+    return sum(1 for _ in _TOKEN_RE.finditer(text))
 
 
 class SummaryService:
     """Service for handling summary generation and processing."""
     
+    # Futures of summaries being generated, keyed by request key
+    _in_flight = {}
+    _in_flight_lock = threading.Lock()
+    
+    @staticmethod
+    def warmup() -> None:
+        """
+        Load NLTK data, the spaCy model and the summarization model ahead of the first request.
+        
+        Failures are reported but not raised, so a missing model only
+        delays loading until the first summary is generated.
+        """
+        try:
+            download_nltk_data()
+            get_stop_words()
+            import nltk
+            nltk.sent_tokenize("Warm up the tokenizer.")
+            get_nlp()
+            get_summarization_pipeline()
+        except Exception as e:
+            print(f"Error preloading models: {e}")
+    
     @staticmethod
     def generate_summary(transcript: str, video_info: Dict[str, str]) -> Tuple[str, str]:
         """
@@ -46,6 +133,49 @@ class SummaryService:
         except Exception as e:
             raise Exception(f"Failed to generate summary: {str(e)}")
     
+    @staticmethod
+    def generate_summary_shared(transcript: str, video_info: Dict[str, str],
+                                key: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Generate a summary, sharing it between concurrent duplicate requests.
+        
+        The summary is generated on the calling thread. Concurrent calls with
+        the same ``key`` wait for the first caller's result (or exception)
+        instead of generating it again, so duplicate requests for a video
+        only run the model once.
+        
+        Args:
+            transcript (str): Video transcript
+            video_info (Dict[str, str]): Video metadata
+            key (Optional[str]): Identifies duplicate requests, e.g. the video URL
+            
+        Returns:
+            Tuple[str, str]: Summary and keywords, as from :meth:`generate_summary`
+        """
+        if key is None:
+            return SummaryService.generate_summary(transcript, video_info)
+        
+        with SummaryService._in_flight_lock:
+            future = SummaryService._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = SummaryService._in_flight[key] = Future()
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = SummaryService.generate_summary(transcript, video_info)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with SummaryService._in_flight_lock:
+                del SummaryService._in_flight[key]
+        
+        future.set_result(result)
+        return result
+    
     @staticmethod
     def _generate_basic_summary(transcript: str, video_info: Dict[str, str]) -> str:
         """
@@ -60,7 +190,7 @@ class SummaryService:
         """
         try:
             # Get first few sentences as a basic summary
-            sentences = transcript.split('.')[:5]
+            sentences = transcript.split('.', 5)[:5]
             basic_summary = '. '.join(sentence.strip() for sentence in sentences if sentence.strip())
             
             if len(basic_summary) > 500:
@@ -84,25 +214,11 @@ class SummaryService:
             str: Comma-separated keywords
         """
         try:
-            # Download NLTK data if needed
-            try:
-                nltk.data.find('tokenizers/punkt')
-                nltk.data.find('corpora/stopwords')
-            except LookupError:
-                nltk.download('punkt', quiet=True)
-                nltk.download('stopwords', quiet=True)
-            
             # Basic keyword extraction
-            stop_words = set(nltk.corpus.stopwords.words('english'))
-            words = nltk.tokenize.word_tokenize(transcript.lower())
-            filtered_words = [word for word in words if word.isalnum() and word not in stop_words and len(word) > 2]
+            stop_words = get_stop_words()
             
-            freq = defaultdict(int)
-            for word in filtered_words:
-                freq[word] += 1
-            
-            sorted_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-            keywords = [word for word, _ in sorted_keywords[:max_keywords]]
+            freq = Counter(word for word in _WORD_RE.findall(transcript.lower()) if word not in stop_words)
+            keywords = [word for word, _ in freq.most_common(max_keywords)]
             
             return ", ".join(keywords) if keywords else "video, content, information"
             
@@ -124,28 +240,22 @@ class SummaryService:
         title = video_info.get('title', '').lower()
         transcript_lower = transcript.lower()
         
-        # Define content type indicators
-        content_indicators = {
-            'tutorial': ['how to', 'tutorial', 'guide', 'step by step', 'learn', 'teach'],
-            'review': ['review', 'opinion', 'rating', 'recommend', 'pros and cons'],
-            'educational': ['explain', 'education', 'science', 'history', 'facts'],
-            'entertainment': ['funny', 'comedy', 'entertainment', 'fun', 'laugh'],
-            'news': ['news', 'breaking', 'report', 'update', 'current'],
-            'gaming': ['game', 'gaming', 'play', 'level', 'boss', 'strategy'],
-            'cooking': ['recipe', 'cook', 'ingredient', 'kitchen', 'food'],
-            'fitness': ['workout', 'exercise', 'fitness', 'training', 'muscle'],
-            'technology': ['tech', 'software', 'app', 'device', 'computer'],
-            'music': ['song', 'music', 'album', 'artist', 'lyrics']
-        }
-        
         # Count indicators in title and transcript
-        scores = {}
-        for content_type, indicators in content_indicators.items():
-            score = 0
-            for indicator in indicators:
-                score += title.count(indicator) * 2  # Title has more weight
-                score += transcript_lower.count(indicator)
-            scores[content_type] = score
+        if _CONTENT_AUTOMATON is not None:
+            # One pass over each text finds every indicator occurrence
+            scores = dict.fromkeys(CONTENT_INDICATORS, 0)
+            for _, content_type in _CONTENT_AUTOMATON.iter(title):
+                scores[content_type] += 2  # Title has more weight
+            for _, content_type in _CONTENT_AUTOMATON.iter(transcript_lower):
+                scores[content_type] += 1
+        else:
+            scores = {}
+            for content_type, indicators in CONTENT_INDICATORS.items():
+                score = 0
+                for indicator in indicators:
+                    score += title.count(indicator) * 2  # Title has more weight
+                    score += transcript_lower.count(indicator)
+                scores[content_type] = score
         
         # Return the type with highest score, or 'general' if no clear type
         if max(scores.values()) > 0:
@@ -164,21 +274,21 @@ class SummaryService:
             List[str]: List of key points or topics
         """
         try:
-            sentences = transcript.split('.')
-            key_points = []
+            if _IMPORTANCE_AUTOMATON is not None:
+                transcript_lower = transcript.lower()
+                # Offsets only line up if lowercasing kept the length unchanged
+                if len(transcript_lower) == len(transcript):
+                    return SummaryService._find_key_sentences(transcript, transcript_lower)
             
-            # Look for sentences that might indicate important points
-            importance_indicators = [
-                'important', 'key', 'main', 'first', 'second', 'third',
-                'remember', 'note', 'tip', 'trick', 'secret', 'best',
-                'worst', 'never', 'always', 'must', 'should', 'need'
-            ]
+            key_points = []
             
-            for sentence in sentences:
-                sentence = sentence.strip()
+            # Look for sentences that might indicate important points,
+            # producing them lazily since the scan stops after five hits
+            for match in _SENTENCE_RE.finditer(transcript):
+                sentence = match.group().strip()
                 if len(sentence) > 20 and len(sentence) < 200:  # Reasonable length
                     sentence_lower = sentence.lower()
-                    if any(indicator in sentence_lower for indicator in importance_indicators):
+                    if any(indicator in sentence_lower for indicator in IMPORTANCE_INDICATORS):
                         key_points.append(sentence)
                         if len(key_points) >= 5:  # Limit to 5 key points
                             break
@@ -188,6 +298,42 @@ class SummaryService:
         except Exception:
             return []
     
+    @staticmethod
+    def _find_key_sentences(transcript: str, transcript_lower: str) -> List[str]:
+        """
+        Find up to five key sentences with a single indicator scan.
+        
+        Each indicator match is mapped to its enclosing sentence by binary
+        search over the sentence boundaries, so sentences without an
+        indicator are never materialized.
+        
+        Args:
+            transcript (str): Video transcript
+            transcript_lower (str): Lowercased transcript of the same length
+            
+        Returns:
+            List[str]: List of key points
+        """
+        boundaries = [match.start() for match in _PERIOD_RE.finditer(transcript)]
+        key_points = []
+        last_index = -1
+        
+        for end, _ in _IMPORTANCE_AUTOMATON.iter(transcript_lower):
+            index = bisect_left(boundaries, end)
+            if index == last_index:
+                continue
+            last_index = index
+            
+            start = boundaries[index - 1] + 1 if index > 0 else 0
+            stop = boundaries[index] if index < len(boundaries) else len(transcript)
+            sentence = transcript[start:stop].strip()
+            if len(sentence) > 20 and len(sentence) < 200:  # Reasonable length
+                key_points.append(sentence)
+                if len(key_points) >= 5:  # Limit to 5 key points
+                    break
+        
+        return key_points
+    
     @staticmethod
     def get_summary_statistics(transcript: str, summary: str) -> Dict[str, any]:
         """
@@ -201,8 +347,8 @@ class SummaryService:
             Dict[str, any]: Statistics dictionary
         """
         try:
-            transcript_words = len(transcript.split())
-            summary_words = len(summary.split())
+            transcript_words = _count_words(transcript)
+            summary_words = _count_words(summary)
             compression_ratio = round((1 - summary_words / transcript_words) * 100, 1) if transcript_words > 0 else 0
             
             return {
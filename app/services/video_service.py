@@ -1,12 +1,38 @@
 # app/services/video_service.py
 
 import re
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
-from app.utils.summarizer import get_transcript, extract_video_info
+from app.utils.summarizer import get_transcript_and_info, extract_video_info
 from app.utils.transcript_fetcher import get_video_id
 
 
+# Supported YouTube URL formats (watch, youtu.be, embed and /v/ links),
+# compiled once per process into a single alternation capturing the video ID
+YOUTUBE_URL_RE = re.compile(
+    r'^https?://(?:www\.)?(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([\w-]+)'
+)
+
+# Transcript cleanup patterns
+WHITESPACE_RE = re.compile(r'\s+')
+ARTIFACT_RE = re.compile(r'\[[^\]]*\]|\([^)]*\)')  # [Music], [Applause], (inaudible), etc.
+
+
+@lru_cache(maxsize=2048)
+def _parse_video_id(url: str) -> Optional[str]:
+    """Validate a URL and extract its video ID in one match; memoized per URL."""
+    url = url.strip()
+    
+    # Cheap checks reject obvious non-YouTube input before the regex runs
+    if not url.startswith(('http://', 'https://')):
+        return None
+    if 'youtube.com' not in url and 'youtu.be' not in url:
+        return None
+    
+    match = YOUTUBE_URL_RE.match(url)
+    return match.group(1) if match else None
+
+
 class VideoService:
     """Service for handling video-related operations."""
     
@@ -23,15 +49,8 @@ class VideoService:
         """
         if not url or not isinstance(url, str):
             return False
-            
-        youtube_patterns = [
-            r'^https?://(www\.)?youtube\.com/watch\?v=[\w-]+',
-            r'^https?://(www\.)?youtu\.be/[\w-]+',
-            r'^https?://(www\.)?youtube\.com/embed/[\w-]+',
-            r'^https?://(www\.)?youtube\.com/v/[\w-]+',
-        ]
         
-        return any(re.match(pattern, url.strip()) for pattern in youtube_patterns)
+        return _parse_video_id(url) is not None
     
     @staticmethod
     def extract_video_id(url: str) -> Optional[str]:
@@ -44,25 +63,10 @@ class VideoService:
         Returns:
             Optional[str]: Video ID if found, None otherwise
         """
-        if not VideoService.validate_youtube_url(url):
+        if not url or not isinstance(url, str):
             return None
-            
-        try:
-            # Handle different YouTube URL formats
-            if 'youtu.be/' in url:
-                return url.split('youtu.be/')[-1].split('?')[0]
-            elif 'youtube.com/watch' in url:
-                parsed = urlparse(url)
-                params = parse_qs(parsed.query)
-                return params.get('v', [None])[0]
-            elif 'youtube.com/embed/' in url:
-                return url.split('youtube.com/embed/')[-1].split('?')[0]
-            elif 'youtube.com/v/' in url:
-                return url.split('youtube.com/v/')[-1].split('?')[0]
-        except Exception:
-            pass
-            
-        return None
+        
+        return _parse_video_id(url)
     
     @staticmethod
     def get_video_data(url: str) -> Tuple[str, Dict[str, str]]:
@@ -79,21 +83,16 @@ class VideoService:
             ValueError: If URL is invalid
             Exception: If transcript or video info cannot be retrieved
         """
-        if not VideoService.validate_youtube_url(url):
-            raise ValueError("Invalid YouTube URL provided")
-        
         video_id = VideoService.extract_video_id(url)
         if not video_id:
-            raise ValueError("Could not extract video ID from URL")
+            raise ValueError("Invalid YouTube URL provided")
         
         try:
-            # Get transcript using the existing utility
-            transcript = get_transcript(url)
+            # Get transcript and video metadata from a single yt-dlp extraction
+            transcript, video_info = get_transcript_and_info(url)
             if not transcript or len(transcript.strip()) == 0:
                 raise Exception("No transcript available for this video")
             
-            # Get video metadata
-            video_info = extract_video_info(url)
             if not video_info:
                 video_info = {
                     'title': 'Unknown Title',
@@ -170,18 +169,14 @@ class VideoService:
             return ""
         
         # Remove extra whitespace and normalize line breaks
-        cleaned = re.sub(r'\s+', ' ', transcript.strip())
+        cleaned = WHITESPACE_RE.sub(' ', transcript.strip())
         
         # Remove common transcript artifacts
-        cleaned = re.sub(r'\[.*?\]', '', cleaned)  # Remove [Music], [Applause], etc.
-        cleaned = re.sub(r'\(.*?\)', '', cleaned)  # Remove (inaudible), etc.
+        cleaned = ARTIFACT_RE.sub('', cleaned)
         
-        # Remove duplicate sentences (common in auto-generated captions)
-        sentences = cleaned.split('.')
-        unique_sentences = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and sentence not in unique_sentences:
-                unique_sentences.append(sentence)
+        # Remove duplicate sentences (common in auto-generated captions),
+        # keeping the first occurrence of each
+        stripped = (sentence.strip() for sentence in cleaned.split('.'))
+        unique_sentences = dict.fromkeys(sentence for sentence in stripped if sentence)
         
         return '. '.join(unique_sentences).strip()
@@ -1,53 +1,251 @@
 # app/utils/advanced_summarizer.py
 
 import re
-import nltk
-from collections import defaultdict
-from transformers import pipeline
+from collections import Counter
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; transcript scanning falls back to regex and substring checks
+    ahocorasick = None
+
+# Leading filler phrases stripped from extracted concepts
+_LEAD_RE = re.compile(r'^(so|and|but|the|this|that|it|you can|this is|this tool|the tool)\s+', re.IGNORECASE)
+
+# Repetitive phrases that appear in fishing transcripts. They are removed one
+# pattern at a time, in this order: an earlier removal can create or break a
+# later match, so a single alternation would not give the same result.
+_REPETITIVE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(can throw it|throw it|it can|it\'s|that\'s)\b',
+    r'\b(perfect for|great for)\s+\w+\s+and\s+(perfect for|great for)',
+    r'\b(weightless|weight)\s+\w*\s*(weightless|weight)',
+    r'\b(we can|we)\s+(throw it|use it|do it)\b',
+    r'\b(and|or)\s+(we can|it can|they can)\b',
+))
+
+_WS_RE = re.compile(r'\s+')
+
+# Rough sentence boundaries: terminal punctuation before a capital, or a blank line
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])|(?:\r?\n){2,}')
+
+# Phrases that mark a sentence as a structured item worth extracting
+MEANINGFUL_PATTERNS = (
+    # Fishing-specific patterns
+    'lure', 'bait', 'tackle', 'rod', 'reel', 'hook', 'line',
+    'cast', 'catch', 'fish', 'bass', 'weight', 'jig',
+    # General item patterns
+    'is called', 'tool called', 'app called', 'feature called',
+    'first', 'second', 'third', 'next',
+    'allows you to', 'helps you', 'enables you to',
+    'perfect for', 'great for', 'ideal for', 'best for',
+    'you can use', 'you can do', 'it can',
+    'main feature', 'key feature', 'important feature',
+    'recommend', 'suggest', 'works well'
+)
+
+_MEANINGFUL_RE = re.compile('|'.join(map(re.escape, MEANINGFUL_PATTERNS)))
+
+# Topic emojis and their keywords, in priority order. Keywords match as
+# substrings, so none is listed that another already covers ('fish' covers 'fishing').
+TOPIC_EMOJIS = (
+    # Fishing/outdoor content (check first for specificity)
+    ('🎣', ('fish', 'bass', 'bait', 'lure')),
+    # Technology/AI content
+    ('🤖', ('ai', 'artificial intelligence', 'tool', 'app', 'software')),
+    # Productivity content
+    ('⚡', ('productivity', 'workflow', 'organize', 'efficiency')),
+    # Learning/Education content
+    ('📚', ('learn', 'study', 'education', 'tutorial', 'guide')),
+    # Business content
+    ('💼', ('business', 'entrepreneur', 'money', 'income')),
+    # Creative content
+    ('🎨', ('creative', 'design', 'content', 'video')),
+)
+
+# One alternation over every emoji keyword, mapping each keyword back to the
+# priority of its category so the text is scanned once
+_TOPIC_EMOJI_PRIORITY = {}
+for _priority, (_emoji, _words) in enumerate(TOPIC_EMOJIS):
+    for _word in _words:
+        _TOPIC_EMOJI_PRIORITY.setdefault(_word, _priority)
+# The lookahead reports overlapping keywords, like the per-keyword substring checks did
+_TOPIC_EMOJI_RE = re.compile('(?=(' + '|'.join(map(re.escape, _TOPIC_EMOJI_PRIORITY)) + '))')
+
+# Keywords counted towards each content theme
+THEMES = {
+    'fishing': [
+        'fish', 'fishing', 'bass', 'lure', 'bait', 'tackle',
+        'rod', 'reel', 'catch', 'angler'
+    ],
+    'outdoor': [
+        'outdoor', 'nature', 'hunting', 'camping',
+        'wilderness', 'adventure'
+    ],
+    'productivity': [
+        'productive', 'efficiency', 'workflow', 'organize', 'manage'
+    ],
+    'learning': [
+        'learn', 'study', 'education', 'knowledge', 'understand'
+    ],
+    'technology': [
+        'ai', 'artificial intelligence', 'software', 'digital', 'tech'
+    ],
+    'business': [
+        'business', 'entrepreneur', 'money', 'income', 'profit'
+    ],
+    'creative': [
+        'creative', 'design', 'content', 'video', 'create'
+    ]
+}
+
+# Single-word keywords are scored from one word count of the transcript;
+# phrases are still counted as substrings
+_THEME_KEYWORDS = {
+    theme: ([k for k in keywords if ' ' not in k], [k for k in keywords if ' ' in k])
+    for theme, keywords in THEMES.items()
+}
+
+_WORD_RE = re.compile(r"[a-z']+")
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz'")
+
+# Transcript words that pick between context and conclusion variants. The
+# lookahead reports overlapping matches, so every flag is seen as a substring.
+CONTEXT_FLAGS = ('budget', 'cheap', 'walmart', 'challenge', 'vs', 'beginner', 'start')
+_CONTEXT_FLAGS_RE = re.compile('(?=(' + '|'.join(CONTEXT_FLAGS) + '))')
+
+
+def context_flags(transcript_lower):
+    """Return the set of CONTEXT_FLAGS found in the lowercased transcript."""
+    return {match.group(1) for match in _CONTEXT_FLAGS_RE.finditer(transcript_lower)}
+
+
+# Transcript-based main topics, in priority order, used when the title gives no hint.
+# Keywords match as substrings, so none is listed that another already covers.
+TRANSCRIPT_TOPICS = (
+    ("fishing strategies and related concepts", ('fish', 'bass', 'lure', 'bait', 'tackle')),
+    ("strategies and related concepts", ('technique', 'method', 'strategy', 'approach')),
+    ("tools and related concepts", ('tool', 'app', 'software')),
+)
+
+
+def _build_scan_automaton():
+    """
+    Build one Aho-Corasick automaton over the theme and topic keywords, or None
+    without pyahocorasick.
+
+    Each keyword maps to ``(keyword, themes, topic_rank)``, where ``themes`` are
+    the themes it scores and ``topic_rank`` is the index of its transcript topic
+    (``len(TRANSCRIPT_TOPICS)`` when it names none).
+    """
+    if ahocorasick is None:
+        return None
+
+    themes_by_keyword = {}
+    for theme, keywords in THEMES.items():
+        for keyword in keywords:
+            themes_by_keyword.setdefault(keyword, []).append(theme)
+    topic_by_keyword = {}
+    for rank, (_, keywords) in enumerate(TRANSCRIPT_TOPICS):
+        for keyword in keywords:
+            topic_by_keyword.setdefault(keyword, rank)
+
+    automaton = ahocorasick.Automaton()
+    for keyword in themes_by_keyword.keys() | topic_by_keyword.keys():
+        automaton.add_word(keyword, (keyword, tuple(themes_by_keyword.get(keyword, ())),
+                                     topic_by_keyword.get(keyword, len(TRANSCRIPT_TOPICS))))
+    automaton.make_automaton()
+    return automaton
+
+
+_SCAN_AUTOMATON = _build_scan_automaton()
+
+
+def scan_transcript(transcript_lower):
+    """
+    Score content themes and find the transcript topic in a single pass.
+
+    Single-word theme keywords count whole-word occurrences and phrases count
+    substring occurrences; topic keywords match as substrings.
+
+    Returns:
+        tuple: (theme scores by theme, transcript topic phrase or None)
+    """
+    if _SCAN_AUTOMATON is None:
+        counts = Counter(_WORD_RE.findall(transcript_lower))
+        theme_scores = {}
+        for theme, (unigrams, multigrams) in _THEME_KEYWORDS.items():
+            theme_scores[theme] = (sum(counts[k] for k in unigrams) +
+                                   sum(transcript_lower.count(k) for k in multigrams))
+        topic = next((phrase for phrase, keywords in TRANSCRIPT_TOPICS
+                      if any(word in transcript_lower for word in keywords)), None)
+        return theme_scores, topic
+
+    theme_scores = dict.fromkeys(THEMES, 0)
+    topic_rank = len(TRANSCRIPT_TOPICS)
+    last = len(transcript_lower) - 1
+    for end, (keyword, themes, rank) in _SCAN_AUTOMATON.iter(transcript_lower):
+        if rank < topic_rank:
+            topic_rank = rank
+        if not themes:
+            continue
+        start = end - len(keyword) + 1
+        if ' ' not in keyword and (
+                (start > 0 and transcript_lower[start - 1] in _WORD_CHARS) or
+                (end < last and transcript_lower[end + 1] in _WORD_CHARS)):
+            continue
+        for theme in themes:
+            theme_scores[theme] += 1
+
+    topic = TRANSCRIPT_TOPICS[topic_rank][0] if topic_rank < len(TRANSCRIPT_TOPICS) else None
+    return theme_scores, topic
+
 
 def create_professional_summary(transcript, video_info):
     """Create a professional, detailed summary similar to the fishing example."""
     
+    # Lowercase the transcript and title once for all keyword checks
+    transcript_lower = transcript.lower()
+    title_lower = video_info['title'].lower()
+    
+    # Score themes and find the transcript topic in one pass
+    theme_scores, transcript_topic = scan_transcript(transcript_lower)
+    
     # Extract the main topic and key elements
-    main_topic = extract_main_topic(transcript, video_info['title'])
+    main_topic = extract_main_topic(title_lower, transcript_topic)
     
     # Get structured content
     key_items = extract_structured_items(transcript)
     
     # Generate the opening line
-    emoji = get_topic_emoji(video_info['title'] + " " + transcript[:500])
-    opening = f'{emoji} The video "{video_info["title"]}" by {video_info["channel"]} '
+    emoji = get_topic_emoji(title_lower + " " + transcript_lower[:500])
+    parts = [f'{emoji} The video "{video_info["title"]}" by {video_info["channel"]} ']
     
     # Create context-aware description
-    if 'tool' in video_info['title'].lower() or 'app' in video_info['title'].lower():
-        opening += f"explores the most effective {main_topic} for enhancing productivity and workflow. "
-    elif 'tip' in video_info['title'].lower() or 'guide' in video_info['title'].lower():
-        opening += f"provides comprehensive guidance on {main_topic}. "
+    if 'tool' in title_lower or 'app' in title_lower:
+        parts.append(f"explores the most effective {main_topic} for enhancing productivity and workflow. ")
+    elif 'tip' in title_lower or 'guide' in title_lower:
+        parts.append(f"provides comprehensive guidance on {main_topic}. ")
     else:
-        opening += f"dives into {main_topic}. "
+        parts.append(f"dives into {main_topic}. ")
     
     # Add context from transcript analysis
-    context = analyze_content_context(transcript)
-    opening += context + "\n\n"
+    context = analyze_content_context(transcript_lower, theme_scores)
+    parts.append(context)
+    parts.append("\n\n")
     
     # Add structured breakdown
     if key_items:
-        opening += "Here's a quick breakdown of the featured items:\n\n"
+        parts.append("Here's a quick breakdown of the featured items:\n\n")
         for item in key_items[:8]:
-            opening += f"{item}\n\n"
+            parts.append(f"{item}\n\n")
     
     # Add concluding insight
-    conclusion = generate_conclusion(transcript, video_info)
-    opening += conclusion
+    conclusion = generate_conclusion(transcript_lower, title_lower)
+    parts.append(conclusion)
     
-    return opening
-
-def extract_main_topic(transcript, title):
-    """Extract the main topic from title and transcript."""
-    # Clean the title to get the core topic
-    title_lower = title.lower()
-    transcript_lower = transcript.lower()
+    return "".join(parts)
 
+def extract_main_topic(title_lower, transcript_topic=None):
+    """Extract the main topic from the lowercased title and the transcript topic."""
     # Fishing and outdoor content
     if any(word in title_lower for word in ['fishing', 'bass', 'lure', 'bait', 'tackle', 'rod', 'reel']):
         if 'challenge' in title_lower or 'vs' in title_lower:
@@ -67,19 +265,12 @@ def extract_main_topic(transcript, title):
     elif 'review' in title_lower:
         return "product reviews and recommendations"
     else:
-        # Extract from transcript with better categorization
-        if any(word in transcript_lower for word in ['fish', 'fishing', 'bass', 'lure', 'bait', 'tackle']):
-            return "fishing strategies and related concepts"
-        elif any(word in transcript_lower for word in ['technique', 'method', 'strategy', 'approach']):
-            return "strategies and related concepts"  # Fixed typo
-        elif any(word in transcript_lower for word in ['tool', 'app', 'software']):
-            return "tools and related concepts"
-        else:
-            return "key concepts and insights"
+        # Fall back to the topic found in the transcript by scan_transcript
+        return transcript_topic or "key concepts and insights"
 
 def extract_structured_items(transcript):
     """Extract structured items like tools, tips, or techniques."""
-    sentences = nltk.sent_tokenize(transcript)
+    sentences = _SENT_SPLIT_RE.split(transcript)
     items = []
     seen_concepts = set()
 
@@ -97,56 +288,36 @@ def extract_structured_items(transcript):
             continue
 
         # Look for meaningful content patterns
-        meaningful_patterns = [
-            # Fishing-specific patterns
-            'lure', 'bait', 'tackle', 'rod', 'reel', 'hook', 'line',
-            'cast', 'catch', 'fish', 'bass', 'weight', 'jig',
-            # General item patterns
-            'is called', 'tool called', 'app called', 'feature called',
-            'first', 'second', 'third', 'next',
-            'allows you to', 'helps you', 'enables you to',
-            'perfect for', 'great for', 'ideal for', 'best for',
-            'you can use', 'you can do', 'it can',
-            'main feature', 'key feature', 'important feature',
-            'recommend', 'suggest', 'works well'
-        ]
-
-        if any(pattern in sentence_lower for pattern in meaningful_patterns):
+        if _MEANINGFUL_RE.search(sentence_lower):
             # Extract the key concept
             concept = extract_concept_from_sentence(sentence_clean)
             if concept and len(concept) > 15:
                 # Check for duplicates or very similar concepts
-                concept_key = concept.lower()[:30]  # Use first 30 chars for similarity check
+                concept_key = concept[:30].lower()  # Use first 30 chars for similarity check
                 if concept_key not in seen_concepts and concept.strip():
                     # Additional quality check - ensure concept is meaningful
                     if (len(concept.split()) >= 4 and
-                        not concept.lower().startswith(('and', 'or', 'but', 'so'))):
+                        not concept_key.startswith(('and', 'or', 'but', 'so'))):
                         seen_concepts.add(concept_key)
                         items.append(f"• {concept}")
+                        # Stop once enough items are found (6 for better quality)
+                        if len(items) >= 6:
+                            break
 
     # Return top unique items
-    return items[:6]  # Reduced to 6 for better quality
+    return items
 
 def extract_concept_from_sentence(sentence):
     """Extract the main concept from a sentence."""
     # Remove common starting phrases
-    pattern = r'^(so|and|but|the|this|that|it|you can|this is|this tool|the tool)\s+'
-    sentence = re.sub(pattern, '', sentence, flags=re.IGNORECASE)
+    sentence = _LEAD_RE.sub('', sentence)
 
     # Remove repetitive phrases that appear in fishing transcripts
-    repetitive_patterns = [
-        r'\b(can throw it|throw it|it can|it\'s|that\'s)\b',
-        r'\b(perfect for|great for)\s+\w+\s+and\s+(perfect for|great for)',
-        r'\b(weightless|weight)\s+\w*\s*(weightless|weight)',
-        r'\b(we can|we)\s+(throw it|use it|do it)\b',
-        r'\b(and|or)\s+(we can|it can|they can)\b',
-    ]
-
-    for pattern in repetitive_patterns:
-        sentence = re.sub(pattern, '', sentence, flags=re.IGNORECASE)
+    for pattern in _REPETITIVE_RES:
+        sentence = pattern.sub('', sentence)
 
     # Clean up extra spaces and incomplete sentences
-    sentence = re.sub(r'\s+', ' ', sentence).strip()
+    sentence = _WS_RE.sub(' ', sentence).strip()
 
     # Skip if sentence is too fragmented after cleaning
     if len(sentence.split()) < 5:
@@ -168,53 +339,23 @@ def extract_concept_from_sentence(sentence):
     else:
         return sentence
 
-def analyze_content_context(transcript):
-    """Analyze the transcript to provide context."""
-    transcript_lower = transcript.lower()
-
+def analyze_content_context(transcript_lower, theme_scores=None):
+    """Analyze the lowercased transcript to provide context."""
     # Count mentions of different themes
-    themes = {
-        'fishing': [
-            'fish', 'fishing', 'bass', 'lure', 'bait', 'tackle',
-            'rod', 'reel', 'catch', 'angler'
-        ],
-        'outdoor': [
-            'outdoor', 'nature', 'hunting', 'camping',
-            'wilderness', 'adventure'
-        ],
-        'productivity': [
-            'productive', 'efficiency', 'workflow', 'organize', 'manage'
-        ],
-        'learning': [
-            'learn', 'study', 'education', 'knowledge', 'understand'
-        ],
-        'technology': [
-            'ai', 'artificial intelligence', 'software', 'digital', 'tech'
-        ],
-        'business': [
-            'business', 'entrepreneur', 'money', 'income', 'profit'
-        ],
-        'creative': [
-            'creative', 'design', 'content', 'video', 'create'
-        ]
-    }
-
-    theme_scores = {}
-    for theme, keywords in themes.items():
-        score = sum(transcript_lower.count(keyword) for keyword in keywords)
-        theme_scores[theme] = score
+    if theme_scores is None:
+        theme_scores, _ = scan_transcript(transcript_lower)
 
     # Get the dominant theme
     dominant_theme = max(theme_scores, key=theme_scores.get)
 
     # Generate context based on dominant theme
     if dominant_theme == 'fishing':
-        if ('budget' in transcript_lower or 'cheap' in transcript_lower or
-            'walmart' in transcript_lower):
+        flags = context_flags(transcript_lower)
+        if 'budget' in flags or 'cheap' in flags or 'walmart' in flags:
             return ("Comparing budget-friendly fishing gear options, the presenter "
                    "tests affordable equipment to help anglers make informed "
                    "purchasing decisions.")
-        elif 'challenge' in transcript_lower or 'vs' in transcript_lower:
+        elif 'challenge' in flags or 'vs' in flags:
             return ("Through hands-on testing and comparison, the presenter "
                    "evaluates different fishing approaches and equipment to "
                    "determine what works best.")
@@ -242,11 +383,8 @@ def analyze_content_context(transcript):
         return ("The presenter shares valuable insights and practical "
                "recommendations for viewers looking to improve their approach.")
 
-def generate_conclusion(transcript, video_info):
-    """Generate a contextual conclusion."""
-    transcript_lower = transcript.lower()
-    title_lower = video_info['title'].lower()
-
+def generate_conclusion(transcript_lower, title_lower):
+    """Generate a contextual conclusion from the lowercased transcript and title."""
     # Fishing-specific conclusions
     if any(word in title_lower for word in ['fishing', 'bass', 'lure', 'bait', 'tackle']):
         if 'budget' in title_lower or 'walmart' in title_lower:
@@ -262,7 +400,8 @@ def generate_conclusion(transcript, video_info):
 
     # Technology/tool conclusions
     elif 'tool' in title_lower or 'app' in title_lower:
-        if 'beginner' in transcript_lower or 'start' in transcript_lower:
+        flags = context_flags(transcript_lower)
+        if 'beginner' in flags or 'start' in flags:
             return ("The video emphasizes choosing the right tools based on your "
                    "experience level and specific needs, making it accessible for "
                    "both beginners and advanced users.")
@@ -277,44 +416,18 @@ def generate_conclusion(transcript, video_info):
         return ("The video provides comprehensive insights and practical "
                "guidance for viewers interested in the topic.")
 
-def get_topic_emoji(text):
-    """Get an appropriate emoji based on the content."""
-    text_lower = text.lower()
-
-    # Fishing/outdoor content (check first for specificity)
-    if any(word in text_lower for word in ['fish', 'fishing', 'bass', 'bait', 'lure']):
-        return '🎣'
-
-    # Technology/AI content
-    elif any(word in text_lower for word in [
-        'ai', 'artificial intelligence', 'tool', 'app', 'software'
-    ]):
-        return '🤖'
-
-    # Productivity content
-    elif any(word in text_lower for word in [
-        'productivity', 'workflow', 'organize', 'efficiency'
-    ]):
-        return '⚡'
-
-    # Learning/Education content
-    elif any(word in text_lower for word in [
-        'learn', 'study', 'education', 'tutorial', 'guide'
-    ]):
-        return '📚'
-
-    # Business content
-    elif any(word in text_lower for word in [
-        'business', 'entrepreneur', 'money', 'income'
-    ]):
-        return '💼'
-
-    # Creative content
-    elif any(word in text_lower for word in [
-        'creative', 'design', 'content', 'video'
-    ]):
-        return '🎨'
+def get_topic_emoji(text_lower):
+    """Get an appropriate emoji based on the lowercased content."""
+    best = None
+    for match in _TOPIC_EMOJI_RE.finditer(text_lower):
+        priority = _TOPIC_EMOJI_PRIORITY[match.group(1)]
+        if best is None or priority < best:
+            best = priority
+            # Nothing outranks the first category
+            if best == 0:
+                break
 
     # Default
-    else:
+    if best is None:
         return '🎥'
+    return TOPIC_EMOJIS[best][0]
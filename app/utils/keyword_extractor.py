@@ -1,14 +1,36 @@
+import hashlib
+import threading
 import spacy
-from collections import Counter
+from spacy.symbols import NOUN, PROPN
+from collections import Counter, OrderedDict
+from functools import lru_cache
 
-# This try-except block handles automatically downloading the model if it's missing.
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Downloading 'en_core_web_sm' model...")
-    from spacy.cli import download
-    download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+# Keyword extraction only needs POS tags and lemmas. The attribute ruler stays
+# enabled because it maps the tagger's tags to the coarse POS used below.
+DISABLED_PIPES = ["parser", "ner"]
+
+# Coarse POS tags kept as keywords, compared as integer symbol IDs
+KEYWORD_POS = (PROPN, NOUN)
+
+# Recent keyword results, keyed by a digest of the text so large transcripts
+# are not kept alive as dictionary keys
+KEYWORD_CACHE_SIZE = 256
+_keyword_cache = OrderedDict()
+_keyword_cache_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """
+    Loads the spaCy model on first use, so importing this module stays cheap.
+    """
+    # This try-except block handles automatically downloading the model if it's missing.
+    try:
+        return spacy.load("en_core_web_sm", disable=DISABLED_PIPES)
+    except OSError:
+        print("Downloading 'en_core_web_sm' model...")
+        from spacy.cli import download
+        download("en_core_web_sm")
+        return spacy.load("en_core_web_sm", disable=DISABLED_PIPES)
 
 def extract_keywords(text, num_keywords=10):
     """
@@ -17,15 +39,37 @@ def extract_keywords(text, num_keywords=10):
     if not text:
         return []
         
-    doc = nlp(text.lower())
-    keywords = []
+    key = (hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), num_keywords)
+    with _keyword_cache_lock:
+        cached = _keyword_cache.get(key)
+        if cached is not None:
+            _keyword_cache.move_to_end(key)
+            return list(cached)
     
-    # Filter for nouns and proper nouns, excluding stop words and punctuation
-    for token in doc:
-        if (token.pos_ in ["PROPN", "NOUN"]) and not token.is_stop and not token.is_punct:
-            keywords.append(token.lemma_)
+    keywords = _keywords_from_doc(get_nlp()(text), num_keywords)
+    
+    with _keyword_cache_lock:
+        _keyword_cache[key] = tuple(keywords)
+        _keyword_cache.move_to_end(key)
+        while len(_keyword_cache) > KEYWORD_CACHE_SIZE:
+            _keyword_cache.popitem(last=False)
+    return keywords
+
+def _keywords_from_doc(doc, num_keywords):
+    """
+    Returns the most common noun and proper-noun lemmas in a parsed document.
+    """
+    # Filter for nouns and proper nouns, excluding stop words and punctuation.
+    # The text is not lowercased before parsing, which would hurt tagging, so
+    # the lemmas are lowercased instead. Short and non-alphabetic lemmas (numbers,
+    # fragments like "'s") are dropped before counting.
+    lemmas = (
+        token.lemma_.lower() for token in doc
+        if token.pos in KEYWORD_POS and not token.is_stop and not token.is_punct
+    )
+    keywords = Counter(lemma for lemma in lemmas if len(lemma) >= 3 and lemma.isalpha())
             
-    # Count the frequency of each keyword and return the most common ones
-    most_common_keywords = [word for word, freq in Counter(keywords).most_common(num_keywords)]
+    # Return the most common keywords
+    most_common_keywords = [word for word, freq in keywords.most_common(num_keywords)]
     
-    return most_common_keywords
\ No newline at end of file
+    return most_common_keywords
@@ -0,0 +1,47 @@
+# app/utils/onnx_summarizer.py
+
+import os
+from transformers import AutoTokenizer, pipeline
+
+# ONNX files exported for a seq2seq model, quantized one by one
+ONNX_COMPONENTS = ('encoder_model', 'decoder_model', 'decoder_with_past_model')
+
+def load_quantized_pipeline(model_name, cache_dir):
+    """
+    Loads a summarization pipeline running an INT8-quantized ONNX export of the model.
+
+    The model is exported and dynamically quantized on first use and saved under
+    ``cache_dir``, so later processes load the quantized files directly.
+    Requires ``optimum[onnxruntime]``; raises ImportError without it.
+    """
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    model_dir = os.path.join(cache_dir, model_name.replace('/', '--'))
+    export_dir = os.path.join(model_dir, 'onnx')
+    quantized_dir = os.path.join(model_dir, 'int8')
+
+    if not os.path.isdir(quantized_dir):
+        print(f"Exporting and quantizing '{model_name}' for ONNX Runtime...")
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+        model.save_pretrained(export_dir)
+
+        # Dynamic quantization needs no calibration data; VNNI kernels are used where available
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        for component in ONNX_COMPONENTS:
+            if os.path.exists(os.path.join(export_dir, f'{component}.onnx')):
+                quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=f'{component}.onnx')
+                quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+        model.config.save_pretrained(quantized_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(quantized_dir)
+
+    with_past = os.path.exists(os.path.join(quantized_dir, 'decoder_with_past_model_quantized.onnx'))
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        quantized_dir,
+        encoder_file_name='encoder_model_quantized.onnx',
+        decoder_file_name='decoder_model_quantized.onnx',
+        decoder_with_past_file_name='decoder_with_past_model_quantized.onnx' if with_past else None,
+        use_cache=with_past,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(quantized_dir)
+    return pipeline("summarization", model=model, tokenizer=tokenizer)
@@ -1,16 +1,137 @@
 # app/utils/summarizer.py
 
+import importlib
 import os
 import re
 import tempfile
-import yt_dlp
-import nltk
-from collections import defaultdict
-from transformers import pipeline
+from collections import Counter
+from functools import lru_cache
 from .advanced_summarizer import create_professional_summary
 
+# Heavy libraries imported on first use rather than with this module, so app
+# and worker startup does not pay for them until they are actually needed
+_LAZY_MODULES = ('nltk', 'yt_dlp')
+
+def __getattr__(name):
+    """Imports a lazily loaded library on first attribute access (PEP 562) and keeps it as a global."""
+    if name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(name)
+    globals()[name] = module
+    return module
+
+def _lazy(name):
+    """Returns a lazily loaded library, or whatever replaced it on this module (e.g. a test patch)."""
+    module = globals().get(name)
+    return module if module is not None else __getattr__(name)
+
+def pipeline(*args, **kwargs):
+    """Builds a transformers pipeline, importing transformers on first use."""
+    from transformers import pipeline as transformers_pipeline
+    return transformers_pipeline(*args, **kwargs)
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; keyword matching falls back to compiled regexes
+    ahocorasick = None
+
+# Words and phrases that mark a sentence as a possible key point
+KEY_POINT_KEYWORDS = (
+    'tool', 'app', 'software', 'platform', 'service',
+    'first', 'second', 'third', 'fourth', 'fifth',
+    'number one', 'number two', 'number three',
+    'tip', 'technique', 'method', 'way to',
+    'best', 'top', 'recommended', 'effective',
+    'important', 'key', 'main', 'feature',
+    'allows you', 'helps you', 'enables you',
+    'perfect for', 'great for', 'ideal for'
+)
+
+def _build_key_point_matcher():
+    """Returns an Aho-Corasick automaton over KEY_POINT_KEYWORDS, or a compiled regex without pyahocorasick."""
+    if ahocorasick is None:
+        return re.compile('|'.join(map(re.escape, KEY_POINT_KEYWORDS)))
+    automaton = ahocorasick.Automaton()
+    for keyword in KEY_POINT_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEY_POINT_MATCHER = _build_key_point_matcher()
+
+def _has_key_point_keyword(text):
+    """Checks whether the lowercased text contains any key point keyword."""
+    if ahocorasick is None:
+        return _KEY_POINT_MATCHER.search(text) is not None
+    return next(_KEY_POINT_MATCHER.iter(text), None) is not None
+
+# Content emojis and their keywords, in priority order
+CONTENT_EMOJIS = (
+    # Fishing/outdoor content
+    ('🎣', ('fish', 'fishing', 'bass', 'bait', 'lure', 'rod', 'reel')),
+    # Cooking/food content
+    ('👨‍🍳', ('cook', 'recipe', 'food', 'kitchen', 'meal')),
+    # Technology content
+    ('💻', ('tech', 'software', 'app', 'computer', 'digital')),
+    # Education/tutorial content
+    ('📚', ('learn', 'tutorial', 'guide', 'how to', 'teach')),
+    # Business/finance content
+    ('💼', ('business', 'money', 'invest', 'finance', 'market')),
+    # Fitness/health content
+    ('💪', ('workout', 'fitness', 'health', 'exercise', 'gym')),
+    # Travel content
+    ('✈️', ('travel', 'trip', 'vacation', 'destination')),
+)
+
+def _build_content_emoji_matcher():
+    """
+    Returns an Aho-Corasick automaton mapping every emoji keyword to its category's
+    priority, or an overlapping-match regex without pyahocorasick.
+    """
+    priorities = {}
+    for priority, (_, keywords) in enumerate(CONTENT_EMOJIS):
+        for keyword in keywords:
+            priorities.setdefault(keyword, priority)
+    if ahocorasick is None:
+        pattern = re.compile('(?=(' + '|'.join(map(re.escape, priorities)) + '))')
+        return pattern, priorities
+    automaton = ahocorasick.Automaton()
+    for keyword, priority in priorities.items():
+        automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton, priorities
+
+_CONTENT_EMOJI_MATCHER, _CONTENT_EMOJI_PRIORITY = _build_content_emoji_matcher()
+
+def _iter_content_emoji_matches(text_lower):
+    """Yields the category priority of every emoji keyword found in one scan of the text."""
+    if ahocorasick is None:
+        for match in _CONTENT_EMOJI_MATCHER.finditer(text_lower):
+            yield _CONTENT_EMOJI_PRIORITY[match.group(1)]
+    else:
+        for _, priority in _CONTENT_EMOJI_MATCHER.iter(text_lower):
+            yield priority
+
+# HTML-style formatting tags in subtitle cues; cue timing lines are skipped by a '-->' check
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Alphanumeric words; keyword counting only keeps these, so no full tokenizer is needed
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Set once NLTK data is known to be present, so later calls skip the lookup
+_nltk_ready = False
+
 def download_nltk_data():
-    """Checks for and downloads NLTK data if missing."""
+    """
+    Checks for and downloads NLTK data if missing.
+
+    Called lazily by the functions that need the data, not at import, so
+    importing this module never blocks on a download.
+    """
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    nltk = _lazy('nltk')
     try:
         nltk.data.find('tokenizers/punkt')
         nltk.data.find('corpora/stopwords')
@@ -18,9 +139,175 @@ def download_nltk_data():
         print("Downloading NLTK data...")
         nltk.download('punkt', quiet=True)
         nltk.download('stopwords', quiet=True)
+    _nltk_ready = True
+
+# Defaults for use outside an application context, from the same environment
+# variables as the model settings in BaseConfig
+_MODEL_SETTING_DEFAULTS = {
+    'SUMMARIZATION_MODEL': os.getenv('SUMMARIZATION_MODEL', 't5-base'),
+    'COMPILE_MODEL': os.getenv('COMPILE_MODEL', 'false').lower() == 'true',
+    'USE_ONNX_RUNTIME': os.getenv('USE_ONNX_RUNTIME', 'false').lower() == 'true',
+    'ONNX_MODEL_DIR': os.getenv('ONNX_MODEL_DIR', 'onnx_models'),
+    'MODEL_DTYPE': os.getenv('MODEL_DTYPE', 'auto').lower(),
+}
+
+def _model_settings():
+    """Returns the model settings from the current app's config, or the environment defaults."""
+    from flask import current_app, has_app_context
+
+    if not has_app_context():
+        return dict(_MODEL_SETTING_DEFAULTS)
+    config = current_app.config
+    return {name: config.get(name, default) for name, default in _MODEL_SETTING_DEFAULTS.items()}
+
+@lru_cache(maxsize=4)
+def _get_pipeline(model_name, use_onnx_runtime, onnx_model_dir, compile_model, model_dtype):
+    """Loads a summarization pipeline once per process, model and model settings."""
+    if use_onnx_runtime:
+        try:
+            from .onnx_summarizer import load_quantized_pipeline
+            return load_quantized_pipeline(model_name, onnx_model_dir)
+        except Exception as e:
+            print(f"Error loading ONNX Runtime model, falling back to PyTorch: {e}")
+
+    dtype, device = _select_dtype_and_device(model_name, model_dtype)
+    summarizer = pipeline("summarization", model=model_name, tokenizer=model_name, framework="pt",
+                          torch_dtype=dtype, device=device)
+    if device == -1:
+        _optimize_for_cpu(summarizer, dtype)
+    if compile_model:
+        _compile_pipeline(summarizer)
+    return summarizer
+
+def _select_dtype_and_device(model_name, model_dtype='auto'):
+    """
+    Picks the weight dtype and device for a model.
+
+    With MODEL_DTYPE=auto, GPUs run in bfloat16 (or float16, except for T5 models,
+    which overflow in float16) and CPUs with AVX-512 BF16 run in bfloat16.
+    Everything else stays in float32.
+    """
+    import torch
+
+    device = 0 if torch.cuda.is_available() else -1
+    if model_dtype != 'auto':
+        return getattr(torch, model_dtype, torch.float32), device
+
+    if device == 0:
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16, device
+        if 't5' not in model_name.lower():
+            return torch.float16, device
+        return torch.float32, device
+
+    cpu_supports_bf16 = getattr(torch.cpu, '_is_avx512_bf16_supported', None)
+    if cpu_supports_bf16 is not None and cpu_supports_bf16():
+        return torch.bfloat16, device
+    return torch.float32, device
+
+def _optimize_for_cpu(summarizer, dtype):
+    """Applies Intel Extension for PyTorch optimizations to a bfloat16 CPU model, if installed."""
+    import torch
+
+    if dtype is not torch.bfloat16:
+        return
+    try:
+        import intel_extension_for_pytorch as ipex
+    except ImportError:
+        return
+    try:
+        summarizer.model = ipex.optimize(summarizer.model.eval(), dtype=dtype)
+    except Exception as e:
+        print(f"Error optimizing summarization model with IPEX: {e}")
+
+def _compile_pipeline(summarizer):
+    """Compiles the pipeline's model with torch.compile and warms it up."""
+    import torch
+
+    # torch.compile is only available from PyTorch 2.0
+    if not hasattr(torch, 'compile'):
+        print("COMPILE_MODEL is set but this PyTorch version has no torch.compile")
+        return
+    model = summarizer.model
+    # Keep the decoder's key/value cache on, so each generation step only runs the
+    # new token through the compiled decoder instead of the whole prefix
+    model.generation_config.use_cache = True
+    try:
+        # Compile the model itself; compiling the pipeline object does nothing
+        summarizer.model = torch.compile(model, mode="reduce-overhead")
+        # Trigger compilation now rather than on the first request
+        summarizer("summarize: " + "warm up the compiled model " * 6, max_length=16, min_length=4, do_sample=False)
+    except Exception as e:
+        print(f"Error compiling summarization model, using it uncompiled: {e}")
+        summarizer.model = model
+
+def get_summarization_pipeline(model_name=None):
+    """Returns the cached summarization pipeline, for the app's configured model by default."""
+    settings = _model_settings()
+    return _get_pipeline(
+        model_name or settings['SUMMARIZATION_MODEL'],
+        settings['USE_ONNX_RUNTIME'],
+        settings['ONNX_MODEL_DIR'],
+        settings['COMPILE_MODEL'],
+        settings['MODEL_DTYPE'],
+    )
+
+def summarize_texts(texts, max_length, min_length, batch_size=8):
+    """
+    Summarizes several texts with one pipeline call, running them in padded batches.
+
+    Returns one summary per text, or "Summary not available." where the
+    pipeline produced no summary text.
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    summarizer = get_summarization_pipeline()
+    results = summarizer(
+        ['summarize: ' + text for text in texts],
+        batch_size=min(batch_size, len(texts)),
+        max_length=max_length,
+        min_length=min_length,
+        do_sample=False,
+        truncation=True,
+    )
+
+    # Extract summary text safely
+    summaries = []
+    for result in results:
+        if isinstance(result, list) and result:
+            result = result[0]
+        if isinstance(result, dict) and 'summary_text' in result:
+            summaries.append(result['summary_text'])
+        else:
+            summaries.append("Summary not available.")
+    return summaries
+
+@lru_cache(maxsize=1)
+def get_stop_words():
+    """Loads the English stopwords once per process."""
+    download_nltk_data()
+    return frozenset(_lazy('nltk').corpus.stopwords.words('english'))
+
+def extract_frequent_words(transcript, num_words=10):
+    """Returns the most frequent non-stopword words in the transcript."""
+    stop_words = get_stop_words()
+    freq = Counter(word for word in _WORD_RE.findall(transcript.lower()) if word not in stop_words)
+    return [word for word, _ in freq.most_common(num_words)]
 
 def get_transcript(youtube_url):
     """Fetches a transcript using yt-dlp and returns it."""
+    transcript, _ = get_transcript_and_info(youtube_url)
+    return transcript
+
+def get_transcript_and_info(youtube_url):
+    """
+    Fetches a transcript and the video info with a single yt-dlp extraction.
+
+    Returns a (transcript, video_info) tuple, with video_info shaped like
+    the result of extract_video_info().
+    """
     ydl_opts = {
         'writesubtitles': True, 'writeautomaticsub': True,
         'subtitleslangs': ['en'], 'skip_download': True,
@@ -28,37 +315,50 @@ def get_transcript(youtube_url):
     }
     with tempfile.TemporaryDirectory() as temp_dir:
         ydl_opts['outtmpl'] = os.path.join(temp_dir, 'subtitle')
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
+        with _lazy('yt_dlp').YoutubeDL(ydl_opts) as ydl:
+            # Extract once and write the subtitles in the same pass
+            info = ydl.extract_info(youtube_url, download=True)
             if not info.get('subtitles') and not info.get('automatic_captions'):
                 raise Exception("No English captions found.")
             
-            ydl.download([youtube_url])
-            subtitle_file = None
-            for file in os.listdir(temp_dir):
-                if file.endswith(('.en.vtt', '.en.srt')):
-                    subtitle_file = os.path.join(temp_dir, file)
-                    break
+            # yt-dlp records where it wrote each requested subtitle
+            subtitle_file = ((info.get('requested_subtitles') or {}).get('en') or {}).get('filepath')
+            if not subtitle_file or not os.path.exists(subtitle_file):
+                subtitle_file = None
+                for file in os.listdir(temp_dir):
+                    if file.endswith(('.en.vtt', '.en.srt')):
+                        subtitle_file = os.path.join(temp_dir, file)
+                        break
             
             if not subtitle_file:
                 raise Exception("Could not find downloaded subtitle file.")
             
+            # Parse the file line by line instead of reading it into memory first
             with open(subtitle_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            return parse_subtitle_content(content)
+                return parse_subtitle_content(f), video_info_from_info(info)
 
 def parse_subtitle_content(content):
-    """Parses subtitle content to clean text."""
-    lines = content.split('\n')
+    """Parses subtitle content, a string or an iterable of lines such as an open file, to clean text."""
+    lines = content.split('\n') if isinstance(content, str) else content
     text_lines = []
     for line in lines:
         line = line.strip()
         if line and '-->' not in line and not line.isdigit() and not line.startswith('WEBVTT'):
-            clean_line = re.sub(r'<[^>]+>', '', line)
+            clean_line = _TAG_RE.sub('', line)
             text_lines.append(clean_line)
     return ' '.join(text_lines)
 
+def video_info_from_info(info):
+    """Builds the video info dict from a yt-dlp info dict."""
+    if info:
+        return {
+            'title': info.get('title', 'Unknown Title'),
+            'channel': info.get('uploader', 'Unknown Channel'),
+            'description': info.get('description', '')
+        }
+    else:
+        return {'title': 'Unknown Title', 'channel': 'Unknown Channel', 'description': ''}
+
 def extract_video_info(youtube_url):
     """Extract video title and channel name from YouTube URL."""
     try:
@@ -66,16 +366,8 @@ def extract_video_info(youtube_url):
             'quiet': True,
             'no_warnings': True,
         }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(youtube_url, download=False)
-            if info:
-                return {
-                    'title': info.get('title', 'Unknown Title'),
-                    'channel': info.get('uploader', 'Unknown Channel'),
-                    'description': info.get('description', '')
-                }
-            else:
-                return {'title': 'Unknown Title', 'channel': 'Unknown Channel', 'description': ''}
+        with _lazy('yt_dlp').YoutubeDL(ydl_opts) as ydl:
+            return video_info_from_info(ydl.extract_info(youtube_url, download=False))
     except Exception as e:
         print(f"Error extracting video info: {e}")
         return {'title': 'Unknown Title', 'channel': 'Unknown Channel', 'description': ''}
@@ -85,24 +377,9 @@ def create_enhanced_summary(transcript, video_info):
 
     # Use T5 model for simplicity and reliability
     try:
-        summarizer = pipeline("summarization", model="t5-base", tokenizer="t5-base", framework="pt")
-
-        # Truncate transcript if too long
-        max_length = 1000
-        truncated_transcript = transcript[:max_length] if len(transcript) > max_length else transcript
-
-        # Generate summary
-        result = summarizer('summarize: ' + truncated_transcript, max_length=200, min_length=50, do_sample=False)
-
-        # Extract summary text safely
-        if isinstance(result, list) and len(result) > 0:
-            summary_dict = result[0]
-            if isinstance(summary_dict, dict) and 'summary_text' in summary_dict:
-                combined_summary = summary_dict['summary_text']
-            else:
-                combined_summary = "Summary not available."
-        else:
-            combined_summary = "Summary not available."
+        # Truncate transcript if too long; slicing leaves shorter transcripts
+        # as they are without copying, and the pipeline truncates tokens itself
+        combined_summary = summarize_texts([transcript[:1000]], max_length=200, min_length=50)[0]
 
     except Exception as e:
         print(f"Error in summarization: {e}")
@@ -116,10 +393,17 @@ def create_enhanced_summary(transcript, video_info):
 
     return formatted_summary
 
+# Only a few entries: each one holds a whole transcript and its sentences
+@lru_cache(maxsize=4)
+def _sent_tokenize_cached(text):
+    """Splits text into sentences with Punkt, memoized for the most recent transcripts."""
+    download_nltk_data()
+    return tuple(_lazy('nltk').sent_tokenize(text))
+
 def extract_key_points(transcript):
     """Extract key points, tips, or items mentioned in the transcript."""
     # Look for numbered lists, bullet points, or repeated patterns
-    sentences = nltk.sent_tokenize(transcript)
+    sentences = _sent_tokenize_cached(transcript)
 
     key_points = []
 
@@ -128,16 +412,7 @@ def extract_key_points(transcript):
         sentence_lower = sentence.lower()
 
         # Look for tool names, specific items, or actionable content
-        if any(keyword in sentence_lower for keyword in [
-            'tool', 'app', 'software', 'platform', 'service',
-            'first', 'second', 'third', 'fourth', 'fifth',
-            'number one', 'number two', 'number three',
-            'tip', 'technique', 'method', 'way to',
-            'best', 'top', 'recommended', 'effective',
-            'important', 'key', 'main', 'feature',
-            'allows you', 'helps you', 'enables you',
-            'perfect for', 'great for', 'ideal for'
-        ]):
+        if _has_key_point_keyword(sentence_lower):
             # Clean and add the sentence
             clean_sentence = sentence.strip()
             # Filter for meaningful sentences
@@ -148,82 +423,62 @@ def extract_key_points(transcript):
                 key_points.append(clean_sentence)
 
     # Remove duplicates while preserving order
-    seen = set()
-    unique_points = []
-    for point in key_points:
-        if point not in seen:
-            seen.add(point)
-            unique_points.append(point)
-
-    return unique_points[:8]  # Limit to top 8 points
+    return list(dict.fromkeys(key_points))[:8]  # Limit to top 8 points
 
 def format_summary(video_info, summary, key_points):
     """Format the summary in the style of the example provided."""
 
+    # Lowercase the summary once for the emoji, the description and the conclusion
+    summary_lower = summary.lower()
+
     # Determine appropriate emoji based on content
-    emoji = get_content_emoji(summary + " " + " ".join(key_points))
+    emoji = content_emoji_for_lower(summary_lower + " " + " ".join(key_points).lower())
 
     # Create the formatted summary
-    formatted = f'{emoji} The video "{video_info["title"]}" by {video_info["channel"]} '
+    parts = [f'{emoji} The video "{video_info["title"]}" by {video_info["channel"]} ']
 
     # Add the main summary with better formatting
-    formatted += f"explores {summary.lower()}\n\n"
+    parts.append(f"explores {summary_lower}\n\n")
 
     # Add key points if available
     if key_points and len(key_points) > 0:
-        formatted += "Here's a quick breakdown of the key points:\n\n"
+        parts.append("Here's a quick breakdown of the key points:\n\n")
 
         for point in key_points[:6]:  # Limit to 6 points for better readability
             # Extract the main concept from each point
             main_concept = extract_main_concept(point)
             if main_concept and len(main_concept.strip()) > 5:  # Only add meaningful points
-                formatted += f"• {main_concept}\n\n"
+                parts.append(f"• {main_concept}\n\n")
 
     # Add a concluding statement based on content
-    if 'tool' in summary.lower() or 'app' in summary.lower():
-        formatted += "The video provides practical recommendations for tools and applications that can enhance productivity and workflow."
-    elif 'tutorial' in summary.lower() or 'how to' in summary.lower():
-        formatted += "The video offers step-by-step guidance and practical tips for viewers to implement."
+    if 'tool' in summary_lower or 'app' in summary_lower:
+        parts.append("The video provides practical recommendations for tools and applications that can enhance productivity and workflow.")
+    elif 'tutorial' in summary_lower or 'how to' in summary_lower:
+        parts.append("The video offers step-by-step guidance and practical tips for viewers to implement.")
     else:
-        formatted += "The video emphasizes practical application and provides valuable insights for viewers interested in the topic."
+        parts.append("The video emphasizes practical application and provides valuable insights for viewers interested in the topic.")
 
-    return formatted
+    return "".join(parts)
 
 def get_content_emoji(text):
     """Determine appropriate emoji based on content."""
-    text_lower = text.lower()
-
-    # Fishing/outdoor content
-    if any(word in text_lower for word in ['fish', 'fishing', 'bass', 'bait', 'lure', 'rod', 'reel']):
-        return '🎣'
-
-    # Cooking/food content
-    elif any(word in text_lower for word in ['cook', 'recipe', 'food', 'kitchen', 'meal']):
-        return '👨‍🍳'
-
-    # Technology content
-    elif any(word in text_lower for word in ['tech', 'software', 'app', 'computer', 'digital']):
-        return '💻'
-
-    # Education/tutorial content
-    elif any(word in text_lower for word in ['learn', 'tutorial', 'guide', 'how to', 'teach']):
-        return '📚'
-
-    # Business/finance content
-    elif any(word in text_lower for word in ['business', 'money', 'invest', 'finance', 'market']):
-        return '💼'
-
-    # Fitness/health content
-    elif any(word in text_lower for word in ['workout', 'fitness', 'health', 'exercise', 'gym']):
-        return '💪'
-
-    # Travel content
-    elif any(word in text_lower for word in ['travel', 'trip', 'vacation', 'destination']):
-        return '✈️'
+    return content_emoji_for_lower(text.lower())
+
+def content_emoji_for_lower(text_lower):
+    """Determine appropriate emoji based on already-lowercased content."""
+    # Keep the category that comes first in CONTENT_EMOJIS, like checking them in order
+    best = None
+    for priority in _iter_content_emoji_matches(text_lower):
+        if best is None or priority < best:
+            best = priority
+            # Nothing outranks the first category
+            if best == 0:
+                break
 
     # Default
-    else:
+    if best is None:
         return '🎥'
+    return CONTENT_EMOJIS[best][0]
 
 def extract_main_concept(sentence):
     """Extract the main concept or action from a sentence."""
@@ -242,6 +497,9 @@ def extract_main_concept(sentence):
 
 def run_summarization(transcript, video_info=None):
     """Takes a transcript and returns an enhanced summary and keywords."""
+    if not transcript or not transcript.strip():
+        raise ValueError("Cannot summarize an empty transcript")
+
     try:
         # Use provided video_info or create a default one
         if video_info is None:
@@ -254,15 +512,8 @@ def run_summarization(transcript, video_info=None):
         # Create enhanced summary using the advanced summarizer
         enhanced_summary = create_professional_summary(transcript, video_info)
 
-        # Extract keywords (keep the existing logic)
-        stop_words = set(nltk.corpus.stopwords.words('english'))
-        words = nltk.tokenize.word_tokenize(transcript.lower())
-        filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
-        freq = defaultdict(int)
-        for word in filtered_words:
-            freq[word] += 1
-        sorted_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-        keywords = [word for word, _ in sorted_keywords[:10]]
+        # Extract keywords
+        keywords = extract_frequent_words(transcript)
 
         return enhanced_summary, ", ".join(keywords)
 
@@ -272,33 +523,12 @@ def run_summarization(transcript, video_info=None):
         traceback.print_exc()
         # Fallback to simple summarization
         try:
-            summarizer = pipeline("summarization", model="t5-base", tokenizer="t5-base", framework="pt")
-            result = summarizer('summarize: ' + transcript[:1000], max_length=150, min_length=30, do_sample=False)
-
-            # Extract summary text safely
-            if isinstance(result, list) and len(result) > 0:
-                summary_dict = result[0]
-                if isinstance(summary_dict, dict) and 'summary_text' in summary_dict:
-                    summary = summary_dict['summary_text']
-                else:
-                    summary = "Summary not available."
-            else:
-                summary = "Summary not available."
+            summary = summarize_texts([transcript[:1000]], max_length=150, min_length=30)[0]
         except Exception as e2:
             print(f"Error in fallback summarization: {e2}")
             summary = "Summary not available."
 
         # Keyword Extraction
-        stop_words = set(nltk.corpus.stopwords.words('english'))
-        words = nltk.tokenize.word_tokenize(transcript.lower())
-        filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
-        freq = defaultdict(int)
-        for word in filtered_words:
-            freq[word] += 1
-        sorted_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-        keywords = [word for word, _ in sorted_keywords[:10]]
-
-        return summary, ", ".join(keywords)
-
-# Ensure NLTK data is ready when the app starts
-download_nltk_data()
\ No newline at end of file
+        keywords = extract_frequent_words(transcript)
+
+        return summary, ", ".join(keywords)
\ No newline at end of file
@@ -0,0 +1,16 @@
+# app/utils/timestamps.py
+
+import time
+from datetime import datetime
+
+# [epoch second, formatted timestamp] of the last formatted second
+_ts_cache = [0, ""]
+
+def utc_now_iso():
+    """Returns the current UTC time as an ISO string, formatted at most once per second."""
+    now = int(time.time())
+    cache = _ts_cache
+    if cache[0] != now:
+        cache[1] = datetime.utcfromtimestamp(now).isoformat()
+        cache[0] = now
+    return cache[1]
@@ -1,18 +1,39 @@
+import html
+import re
 import requests
 from bs4 import BeautifulSoup
 
+# Reused across requests so connections to YouTube are kept alive
+_session = requests.Session()
+_session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# The description meta tag as YouTube writes it, matched on the raw page bytes
+_DESCRIPTION_RE = re.compile(rb'<meta name="description" content="([^"]*)"')
+_HEAD_END = b'</head>'
+_RESCAN_BYTES = 8192
+
 def scrape_video_description(video_url):
     """
     Scrapes the video description from a YouTube video page as a fallback.
     """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        response = requests.get(video_url, headers=headers)
-        response.raise_for_status()
+        # Stream the page and stop reading once the <head> has arrived
+        with _session.get(video_url, stream=True) as response:
+            response.raise_for_status()
+            page = bytearray()
+            for chunk in response.iter_content(chunk_size=16384):
+                # Only rescan the tail that a tag split across chunks could start in
+                pos = max(0, len(page) - _RESCAN_BYTES)
+                page += chunk
+                match = _DESCRIPTION_RE.search(page, pos)
+                if match:
+                    content = match.group(1).decode(response.encoding or 'utf-8', errors='replace')
+                    return html.unescape(content) or None
+                if page.find(_HEAD_END, pos) != -1:
+                    break
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Fall back to parsing what was read if the tag is written differently
+        soup = BeautifulSoup(bytes(page), 'html.parser')
         
         # This selector reliably targets the meta tag containing the description
         description_tag = soup.find("meta", {"name": "description"})
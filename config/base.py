@@ -1,12 +1,28 @@
 # config/base.py
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def freeze(value):
+    """
+    Return a read-only copy of a config value, recursively.
+    
+    Dicts become read-only mappings and lists, tuples and sets become tuples, so
+    values cached and shared by the config getters cannot be changed by callers.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
 class BaseConfig:
     """Base configuration class with common settings."""
     
@@ -26,6 +42,12 @@ class BaseConfig:
     CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
     CACHE_DIR = os.getenv('CACHE_DIR', 'cache')
     CACHE_DURATION_HOURS = int(os.getenv('CACHE_DURATION_HOURS', '24'))
+    CACHE_STALE_HOURS = int(os.getenv('CACHE_STALE_HOURS', '24'))  # Serve-while-refreshing window
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'file').lower()  # 'file' or 'redis'
+    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    REDIS_POOL_SIZE = int(os.getenv('REDIS_POOL_SIZE', '32'))  # Connections per pool and process
+    REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv('REDIS_HEALTH_CHECK_INTERVAL', '30'))  # Seconds
+    VIDEO_INFO_CACHE_SECONDS = int(os.getenv('VIDEO_INFO_CACHE_SECONDS', '1800'))
     
     # Summarization settings
     DEFAULT_SUMMARY_TYPE = os.getenv('DEFAULT_SUMMARY_TYPE', 'enhanced')
@@ -36,6 +58,15 @@ class BaseConfig:
     SUMMARIZATION_MODEL = os.getenv('SUMMARIZATION_MODEL', 't5-base')
     MAX_SUMMARY_LENGTH = int(os.getenv('MAX_SUMMARY_LENGTH', '200'))
     MIN_SUMMARY_LENGTH = int(os.getenv('MIN_SUMMARY_LENGTH', '50'))
+    PRELOAD_MODELS = os.getenv('PRELOAD_MODELS', 'false').lower() == 'true'  # Load models at startup
+    COMPILE_MODEL = os.getenv('COMPILE_MODEL', 'false').lower() == 'true'  # torch.compile the model (PyTorch 2.0+)
+    USE_ONNX_RUNTIME = os.getenv('USE_ONNX_RUNTIME', 'false').lower() == 'true'  # INT8 ONNX model, needs optimum
+    ONNX_MODEL_DIR = os.getenv('ONNX_MODEL_DIR', 'onnx_models')  # Exported and quantized models
+    MODEL_DTYPE = os.getenv('MODEL_DTYPE', 'auto').lower()  # auto, float32, float16 or bfloat16
+    
+    # Batch summarization settings
+    BATCH_MAX_URLS = int(os.getenv('BATCH_MAX_URLS', '20'))
+    BATCH_MAX_CONCURRENT = int(os.getenv('BATCH_MAX_CONCURRENT', '5'))
     
     # Rate limiting settings
     RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'false').lower() == 'true'
@@ -44,6 +75,8 @@ class BaseConfig:
     # Logging settings
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FORMAT = os.getenv('LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    LOG_BUFFER_CAPACITY = int(os.getenv('LOG_BUFFER_CAPACITY', '100'))  # Records buffered per write
+    LOG_FLUSH_INTERVAL = float(os.getenv('LOG_FLUSH_INTERVAL', '1.0'))  # Seconds between writes
     
     # Security settings
     WTF_CSRF_ENABLED = os.getenv('WTF_CSRF_ENABLED', 'true').lower() == 'true'
@@ -57,6 +90,9 @@ class BaseConfig:
     THREADING = os.getenv('THREADING', 'true').lower() == 'true'
     PROCESSES = int(os.getenv('PROCESSES', '1'))
     
+    # Blueprints to register (comma-separated, see app.BLUEPRINTS)
+    ENABLED_BLUEPRINTS = [name.strip() for name in os.getenv('ENABLED_BLUEPRINTS', 'api').split(',') if name.strip()]
+    
     # Feature flags
     ENABLE_KEYWORD_EXTRACTION = os.getenv('ENABLE_KEYWORD_EXTRACTION', 'true').lower() == 'true'
     ENABLE_ADVANCED_SUMMARIZATION = os.getenv('ENABLE_ADVANCED_SUMMARIZATION', 'true').lower() == 'true'
@@ -68,37 +104,45 @@ class BaseConfig:
         pass
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_cache_config(cls):
-        """Get cache-related configuration."""
-        return {
+        """Get cache-related configuration, built once per class (read-only)."""
+        return freeze({
             'enabled': cls.CACHE_ENABLED,
+            'backend': cls.CACHE_BACKEND,
             'directory': cls.CACHE_DIR,
-            'duration_hours': cls.CACHE_DURATION_HOURS
-        }
+            'redis_url': cls.REDIS_URL,
+            'redis_pool_size': cls.REDIS_POOL_SIZE,
+            'duration_hours': cls.CACHE_DURATION_HOURS,
+            'stale_hours': cls.CACHE_STALE_HOURS,
+            'video_info_seconds': cls.VIDEO_INFO_CACHE_SECONDS
+        })
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_summarization_config(cls):
-        """Get summarization-related configuration."""
-        return {
+        """Get summarization-related configuration, built once per class (read-only)."""
+        return freeze({
             'model': cls.SUMMARIZATION_MODEL,
             'max_length': cls.MAX_SUMMARY_LENGTH,
             'min_length': cls.MIN_SUMMARY_LENGTH,
             'max_transcript_length': cls.MAX_TRANSCRIPT_LENGTH,
             'min_transcript_length': cls.MIN_TRANSCRIPT_LENGTH,
             'default_type': cls.DEFAULT_SUMMARY_TYPE
-        }
+        })
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_feature_flags(cls):
-        """Get feature flag configuration."""
-        return {
+        """Get feature flag configuration, built once per class (read-only)."""
+        return freeze({
             'keyword_extraction': cls.ENABLE_KEYWORD_EXTRACTION,
             'advanced_summarization': cls.ENABLE_ADVANCED_SUMMARIZATION,
             'content_type_detection': cls.ENABLE_CONTENT_TYPE_DETECTION,
             'rate_limiting': cls.RATE_LIMIT_ENABLED,
             'caching': cls.CACHE_ENABLED,
             'cors': cls.CORS_ENABLED
-        }
+        })
     
     @classmethod
     def validate_config(cls):
@@ -125,11 +169,23 @@ class BaseConfig:
         if cls.CACHE_DURATION_HOURS <= 0:
             errors.append("CACHE_DURATION_HOURS must be positive")
         
+        if cls.CACHE_STALE_HOURS < 0:
+            errors.append("CACHE_STALE_HOURS must not be negative")
+        
+        if cls.CACHE_BACKEND not in ('file', 'redis'):
+            errors.append("CACHE_BACKEND must be one of: file, redis")
+        
+        if cls.REDIS_POOL_SIZE <= 0:
+            errors.append("REDIS_POOL_SIZE must be positive")
+        
         # Validate model settings
         valid_models = ['t5-base', 't5-small', 't5-large', 'facebook/bart-base', 'facebook/bart-large']
         if cls.SUMMARIZATION_MODEL not in valid_models:
             errors.append(f"SUMMARIZATION_MODEL must be one of: {', '.join(valid_models)}")
         
+        if cls.MODEL_DTYPE not in ('auto', 'float32', 'float16', 'bfloat16'):
+            errors.append("MODEL_DTYPE must be one of: auto, float32, float16, bfloat16")
+        
         # Validate summary types
         valid_types = ['basic', 'enhanced', 'professional', 'detailed']
         if cls.DEFAULT_SUMMARY_TYPE not in valid_types:
@@ -28,6 +28,7 @@ class DevelopmentConfig(BaseConfig):
     CACHE_ENABLED = True
     CACHE_DIR = 'dev_cache'
     CACHE_DURATION_HOURS = 1  # Shorter cache for development
+    REDIS_URL = os.getenv('DEV_REDIS_URL', 'redis://localhost:6379/0')
     
     # Development model settings (faster models for quicker iteration)
     SUMMARIZATION_MODEL = 't5-small'  # Smaller model for faster development
@@ -74,5 +75,5 @@ class DevelopmentConfig(BaseConfig):
     
     @classmethod
     def get_redis_url(cls):
-        """Get Redis URL for development caching (if needed in future)."""
-        return os.getenv('DEV_REDIS_URL', 'redis://localhost:6379/0')
+        """Get Redis URL for development caching."""
+        return cls.REDIS_URL
@@ -1,9 +1,29 @@
 # config/production.py
 
 import os
+import logging
+from functools import lru_cache
 from .base import BaseConfig
 
 
+# Read once; an unset or empty value means no origins are allowed
+_CORS_ORIGINS = os.getenv('CORS_ORIGINS')
+
+def _default_processes():
+    """Default worker count: 2 x usable CPUs + 1, honouring the process's CPU affinity."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available outside Linux
+        cpus = os.cpu_count() or 1
+    return cpus * 2 + 1
+
+
+# Shared by every production file handler
+_PROD_FORMATTER = logging.Formatter(
+    '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
+)
+
+
 class ProductionConfig(BaseConfig):
     """Production configuration."""
     
@@ -20,15 +40,18 @@ class ProductionConfig(BaseConfig):
     
     # CORS settings for production
     CORS_ENABLED = True
-    CORS_ORIGINS = os.getenv('CORS_ORIGINS', '').split(',') if os.getenv('CORS_ORIGINS') else []
+    CORS_ORIGINS = _CORS_ORIGINS.split(',') if _CORS_ORIGINS else []
     
     # Logging settings for production
     LOG_LEVEL = 'WARNING'
+    LOG_BUFFER_CAPACITY = int(os.getenv('LOG_BUFFER_CAPACITY', '512'))  # Flushed every LOG_FLUSH_INTERVAL and on WARNING
     
     # Cache settings for production
     CACHE_ENABLED = True
     CACHE_DIR = os.getenv('CACHE_DIR', '/tmp/youtube_summarizer_cache')
     CACHE_DURATION_HOURS = 24
+    # Redis is used whenever it is configured, unless a backend is chosen explicitly
+    CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'file').lower()
     
     # Production model settings
     SUMMARIZATION_MODEL = os.getenv('SUMMARIZATION_MODEL', 't5-base')
@@ -47,7 +70,7 @@ class ProductionConfig(BaseConfig):
     
     # Performance settings for production
     THREADING = True
-    PROCESSES = int(os.getenv('WEB_CONCURRENCY', '4'))
+    PROCESSES = int(os.getenv('WEB_CONCURRENCY') or _default_processes())
     
     # Production-specific paths
     STATIC_FOLDER = 'app/static'
@@ -58,9 +81,10 @@ class ProductionConfig(BaseConfig):
         """Initialize application for production."""
         BaseConfig.init_app(app)
         
-        # Production-specific initialization
-        import logging
-        from logging.handlers import RotatingFileHandler
+        # Production-specific initialization; imported here since app imports config
+        from app.logging_handlers import (
+            CountingRotatingFileHandler, attach_queue_handler, exit_on_sigterm
+        )
         
         # Set up file logging for production
         if not app.debug and not app.testing:
@@ -68,17 +92,25 @@ class ProductionConfig(BaseConfig):
             if not os.path.exists('logs'):
                 os.mkdir('logs')
             
-            # Set up rotating file handler
-            file_handler = RotatingFileHandler(
+            # Set up rotating file handler; the file size is tracked in memory
+            file_handler = CountingRotatingFileHandler(
                 'logs/youtube_summarizer.log',
                 maxBytes=10240000,  # 10MB
                 backupCount=10
             )
-            file_handler.setFormatter(logging.Formatter(
-                '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
-            ))
+            file_handler.setFormatter(_PROD_FORMATTER)
             file_handler.setLevel(logging.INFO)
-            app.logger.addHandler(file_handler)
+            
+            # Buffer records and write them from a background listener; the
+            # buffer is flushed on a timer and at once for warnings and errors
+            app.extensions['log_listener'] = attach_queue_handler(
+                app.logger,
+                file_handler,
+                capacity=app.config.get('LOG_BUFFER_CAPACITY', 512),
+                flush_interval=app.config.get('LOG_FLUSH_INTERVAL', 1.0),
+                flush_level=logging.WARNING
+            )
+            exit_on_sigterm()
             
             app.logger.setLevel(logging.INFO)
             app.logger.info('YouTube Summarizer startup')
@@ -92,31 +124,34 @@ class ProductionConfig(BaseConfig):
         
         # Create cache directory if it doesn't exist
         cache_dir = ProductionConfig.CACHE_DIR
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir, exist_ok=True)
+        os.makedirs(cache_dir, exist_ok=True)
     
     @classmethod
     def validate_production_config(cls):
         """Validate production-specific configuration."""
-        errors = cls.validate_config()
-        
-        # Additional production-specific validations
-        if not cls.SECRET_KEY:
-            errors.append("SECRET_KEY environment variable must be set in production")
-        
-        if cls.SECRET_KEY == 'dev-secret-key-change-in-production':
-            errors.append("SECRET_KEY must be changed from default value in production")
-        
-        if not cls.YOUTUBE_API_KEY:
-            errors.append("YOUTUBE_API_KEY should be set for optimal performance in production")
-        
-        if cls.DEBUG:
-            errors.append("DEBUG should be False in production")
-        
-        if not cls.CORS_ORIGINS:
-            errors.append("CORS_ORIGINS should be configured for production")
-        
-        return errors
+        return list(cls._validate_production_config())
+    
+    # Production-specific validations as (failing predicate, message) pairs
+    _PRODUCTION_CHECKS = (
+        (lambda c: not c.SECRET_KEY,
+         "SECRET_KEY environment variable must be set in production"),
+        (lambda c: c.SECRET_KEY == 'dev-secret-key-change-in-production',
+         "SECRET_KEY must be changed from default value in production"),
+        (lambda c: not c.YOUTUBE_API_KEY,
+         "YOUTUBE_API_KEY should be set for optimal performance in production"),
+        (lambda c: c.DEBUG,
+         "DEBUG should be False in production"),
+        (lambda c: not c.CORS_ORIGINS,
+         "CORS_ORIGINS should be configured for production"),
+    )
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _validate_production_config(cls):
+        """Run the production validations once per class; settings are fixed at import."""
+        return tuple(cls.validate_config()) + tuple(
+            message for failed, message in cls._PRODUCTION_CHECKS if failed(cls)
+        )
     
     @classmethod
     def get_database_url(cls):
@@ -125,8 +160,8 @@ class ProductionConfig(BaseConfig):
     
     @classmethod
     def get_redis_url(cls):
-        """Get Redis URL for production caching (if needed in future)."""
-        return os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        """Get Redis URL for production caching."""
+        return cls.REDIS_URL
     
     @classmethod
     def get_sentry_dsn(cls):
@@ -2,7 +2,21 @@
 
 import os
 import tempfile
-from .base import BaseConfig
+from functools import lru_cache
+from .base import BaseConfig, freeze
+
+
+class _LazyTempDir:
+    """Class attribute that creates a temporary directory on first access."""
+    
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.path = None
+    
+    def __get__(self, obj, owner=None):
+        if self.path is None:
+            self.path = tempfile.mkdtemp(prefix=self.prefix)
+        return self.path
 
 
 class TestingConfig(BaseConfig):
@@ -27,13 +41,15 @@ class TestingConfig(BaseConfig):
     
     # Cache settings for testing
     CACHE_ENABLED = False  # Disable caching for consistent test results
-    CACHE_DIR = tempfile.mkdtemp()  # Use temporary directory
+    CACHE_BACKEND = 'file'  # Never require a Redis server for tests
+    CACHE_DIR = _LazyTempDir('yt_sum_test_')  # Temporary directory, created when first used
     CACHE_DURATION_HOURS = 1
     
     # Testing model settings (use smallest/fastest models)
     SUMMARIZATION_MODEL = 't5-small'
     MAX_SUMMARY_LENGTH = 100
     MIN_SUMMARY_LENGTH = 20
+    PRELOAD_MODELS = False  # Never load models when creating test apps
     
     # Testing limits (smaller for faster tests)
     MAX_TRANSCRIPT_LENGTH = 5000
@@ -69,8 +85,7 @@ class TestingConfig(BaseConfig):
         
         # Create temporary cache directory
         cache_dir = TestingConfig.CACHE_DIR
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir, exist_ok=True)
+        os.makedirs(cache_dir, exist_ok=True)
     
     @classmethod
     def get_test_data_dir(cls):
@@ -78,31 +93,34 @@ class TestingConfig(BaseConfig):
         return os.path.join(os.path.dirname(__file__), '..', 'tests', 'data')
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_mock_config(cls):
-        """Get configuration for mocking external services."""
-        return {
+        """Get configuration for mocking external services, built once (read-only)."""
+        return freeze({
             'mock_youtube_api': True,
             'mock_transformers': True,
             'mock_nltk': True,
             'mock_file_operations': True,
             'use_test_data': True
-        }
+        })
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_test_urls(cls):
-        """Get test URLs for testing."""
-        return {
+        """Get test URLs for testing, built once (read-only)."""
+        return freeze({
             'valid_youtube_url': 'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
             'valid_youtu_be_url': 'https://youtu.be/dQw4w9WgXcQ',
             'valid_embed_url': 'https://www.youtube.com/embed/dQw4w9WgXcQ',
             'invalid_url': 'https://www.example.com/not-youtube',
             'malformed_url': 'not-a-url-at-all'
-        }
+        })
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_test_data(cls):
-        """Get test data for testing."""
-        return {
+        """Get test data for testing, built once (read-only)."""
+        return freeze({
             'sample_transcript': """
                 Welcome to this tutorial video. Today we're going to learn about Python programming.
                 First, let's talk about variables. Variables are used to store data in Python.
@@ -121,16 +139,12 @@ class TestingConfig(BaseConfig):
             },
             'sample_summary': 'This video teaches Python programming basics including variables and functions.',
             'sample_keywords': ['python', 'programming', 'variables', 'functions', 'tutorial']
-        }
+        })
     
     @classmethod
     def cleanup_test_environment(cls):
         """Clean up test environment after tests."""
         import shutil
         
-        # Clean up temporary cache directory
-        if os.path.exists(cls.CACHE_DIR):
-            try:
-                shutil.rmtree(cls.CACHE_DIR)
-            except Exception:
-                pass  # Ignore cleanup errors
+        # Clean up temporary cache directory; missing directories and errors are ignored
+        shutil.rmtree(cls.CACHE_DIR, ignore_errors=True)
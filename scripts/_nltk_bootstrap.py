@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Download the NLTK data used by YouTube Summarizer.
+
+Run by setup.py with the virtual environment's interpreter.
+"""
+
+import nltk
+import ssl
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    _create_unverified_https_context = ssl._create_unverified_context
+except AttributeError:
+    pass
+else:
+    ssl._create_default_https_context = _create_unverified_https_context
+
+# Package id and the resource path that shows it is already installed
+NLTK_PACKAGES = [('punkt', 'tokenizers/punkt'), ('stopwords', 'corpora/stopwords')]
+
+needed = []
+for package, path in NLTK_PACKAGES:
+    try:
+        nltk.data.find(path)
+    except LookupError:
+        needed.append(package)
+
+if needed:
+    print(f"Downloading {', '.join(needed)}...")
+    with ThreadPoolExecutor(max_workers=len(needed)) as executor:
+        results = list(executor.map(lambda package: nltk.download(package, quiet=True), needed))
+    if not all(results):
+        raise SystemExit("NLTK data download failed")
+    print("NLTK data downloaded successfully!")
+else:
+    print("NLTK data already present")
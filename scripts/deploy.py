@@ -6,12 +6,31 @@ This script automates deployment tasks for different environments.
 """
 
 import os
+import re
 import sys
+import mmap
 import subprocess
 import argparse
-import json
 from pathlib import Path
-from datetime import datetime
+
+# json, datetime, hashlib, tarfile and concurrent.futures are imported where they are
+# used, so argument parsing and --help stay fast
+
+# Variables that must be set (and non-empty) in each environment's env file
+REQUIRED_ENV_VARS = {
+    'production': ['SECRET_KEY', 'FLASK_ENV'],
+    'staging': ['SECRET_KEY', 'FLASK_ENV'],
+    'development': ['FLASK_ENV']
+}
+
+# One `NAME=value` line pattern per environment, matching only its required names
+_ENV_VAR_PATTERNS = {
+    env: re.compile(
+        rb'^[ \t]*(' + b'|'.join(re.escape(var.encode()) for var in names) + rb')=(.*?)[ \t\r]*$',
+        re.MULTILINE
+    )
+    for env, names in REQUIRED_ENV_VARS.items()
+}
 
 
 def run_command(command, check=True, shell=False, cwd=None):
@@ -20,7 +39,8 @@ def run_command(command, check=True, shell=False, cwd=None):
         if shell:
             result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True, cwd=cwd)
         else:
-            result = subprocess.run(command.split(), check=check, capture_output=True, text=True, cwd=cwd)
+            args = command if isinstance(command, (list, tuple)) else command.split()
+            result = subprocess.run(args, check=check, capture_output=True, text=True, cwd=cwd)
         return result
     except subprocess.CalledProcessError as e:
         print(f"Error running command: {command}")
@@ -28,11 +48,12 @@ def run_command(command, check=True, shell=False, cwd=None):
         return None
 
 
-def check_git_status():
-    """Check if git repository is clean."""
+def check_git_status(result=None):
+    """Check if git repository is clean, optionally from an already run ``git status``."""
     print("🔍 Checking git status...")
     
-    result = run_command("git status --porcelain")
+    if result is None:
+        result = run_command("git status --porcelain")
     if result is None:
         print("❌ Failed to check git status")
         return False
@@ -51,7 +72,8 @@ def run_tests():
     """Run tests before deployment."""
     print("🧪 Running tests...")
     
-    result = run_command("python -m pytest tests/ -v --tb=short")
+    result = run_command([sys.executable, '-m', 'pytest', 'tests/', '-q', '-x', '-p', 'no:cacheprovider',
+                          '--no-header', '--tb=short'])
     if result is None or result.returncode != 0:
         print("❌ Tests failed!")
         if result:
@@ -65,6 +87,8 @@ def run_tests():
 
 def build_docker_image(tag=None):
     """Build Docker image."""
+    from datetime import datetime
+    
     if tag is None:
         tag = f"youtube-summarizer:{datetime.now().strftime('%Y%m%d-%H%M%S')}"
     
@@ -166,15 +190,21 @@ def deploy_docker_registry(image_tag, registry_url):
     return True
 
 
-def update_version():
-    """Update version information."""
+def update_version(commit_result=None):
+    """Update version information, optionally from an already run ``git rev-parse``."""
+    import json
+    from datetime import datetime
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
     print("📝 Updating version information...")
     
     version_file = Path("version.json")
     
     if version_file.exists():
-        with open(version_file, 'r') as f:
-            version_data = json.load(f)
+        version_data = orjson.loads(version_file.read_bytes()) if orjson else json.loads(version_file.read_text())
     else:
         version_data = {"version": "1.0.0", "build": 0}
     
@@ -183,12 +213,18 @@ def update_version():
     version_data["deployed_at"] = datetime.now().isoformat()
     
     # Get git commit hash
-    result = run_command("git rev-parse HEAD", check=False)
+    result = commit_result or run_command("git rev-parse HEAD", check=False)
     if result and result.returncode == 0:
         version_data["commit"] = result.stdout.strip()[:8]
     
-    with open(version_file, 'w') as f:
-        json.dump(version_data, f, indent=2)
+    # Write to a temporary file and swap it in so a crash never leaves a partial file
+    if orjson:
+        data = orjson.dumps(version_data, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(version_data, indent=2).encode('utf-8')
+    tmp_file = version_file.with_suffix('.tmp')
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, version_file)
     
     print(f"✅ Version updated: {version_data['version']}.{version_data['build']}")
     return version_data
@@ -196,6 +232,10 @@ def update_version():
 
 def create_deployment_backup():
     """Create a backup before deployment."""
+    import hashlib
+    import tarfile
+    from datetime import datetime
+    
     print("💾 Creating deployment backup...")
     
     backup_dir = Path("backups")
@@ -204,25 +244,40 @@ def create_deployment_backup():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_file = backup_dir / f"backup_{timestamp}.tar.gz"
     
-    # Create backup excluding unnecessary files
-    exclude_patterns = [
-        "--exclude=venv",
-        "--exclude=__pycache__",
-        "--exclude=*.pyc",
-        "--exclude=.git",
-        "--exclude=cache",
-        "--exclude=logs",
-        "--exclude=backups"
-    ]
+    # Create backup excluding unnecessary files; fast compression keeps this quick
+    exclude_names = {'venv', '__pycache__', '.git', 'cache', 'logs', 'backups'}
     
-    exclude_str = " ".join(exclude_patterns)
-    result = run_command(f"tar -czf {backup_file} {exclude_str} .", shell=True)
+    def exclude_filter(tarinfo):
+        if exclude_names.intersection(tarinfo.name.split('/')) or tarinfo.name.endswith('.pyc'):
+            return None
+        return tarinfo
     
-    if result is None:
-        print("❌ Failed to create backup")
+    # Hash the archive as it is written, so it never has to be read back
+    digest = hashlib.sha256()
+    
+    class HashingWriter:
+        def __init__(self, f):
+            self.f = f
+        
+        def write(self, data):
+            digest.update(data)
+            return self.f.write(data)
+        
+        def flush(self):
+            self.f.flush()
+    
+    try:
+        with open(backup_file, 'wb') as f:
+            with tarfile.open(fileobj=HashingWriter(f), mode='w:gz', compresslevel=1) as tar:
+                tar.add('.', filter=exclude_filter)
+        # Same format as sha256sum, so the backup can be checked with `sha256sum -c`
+        Path(f"{backup_file}.sha256").write_text(f"{digest.hexdigest()}  {backup_file.name}\n")
+    except (OSError, tarfile.TarError) as e:
+        print(f"❌ Failed to create backup: {e}")
         return False
     
     print(f"✅ Backup created: {backup_file}")
+    print(f"   SHA-256: {digest.hexdigest()}")
     return True
 
 
@@ -230,12 +285,6 @@ def validate_environment(env):
     """Validate environment configuration."""
     print(f"🔍 Validating {env} environment...")
     
-    required_vars = {
-        'production': ['SECRET_KEY', 'FLASK_ENV'],
-        'staging': ['SECRET_KEY', 'FLASK_ENV'],
-        'development': ['FLASK_ENV']
-    }
-    
     env_file = Path(f".env.{env}")
     if not env_file.exists():
         env_file = Path(".env")
@@ -244,20 +293,16 @@ def validate_environment(env):
         print(f"❌ Environment file not found: {env_file}")
         return False
     
-    # Read environment variables
+    # Scan the file once for the required variables only
     env_vars = {}
-    with open(env_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key] = value
+    names = REQUIRED_ENV_VARS.get(env, [])
+    if names and env_file.stat().st_size:
+        pattern = _ENV_VAR_PATTERNS[env]
+        with open(env_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            env_vars = {m.group(1).decode(): m.group(2).decode() for m in pattern.finditer(mm)}
     
     # Check required variables
-    missing_vars = []
-    for var in required_vars.get(env, []):
-        if var not in env_vars or not env_vars[var]:
-            missing_vars.append(var)
+    missing_vars = [var for var in names if not env_vars.get(var)]
     
     if missing_vars:
         print(f"❌ Missing required environment variables: {', '.join(missing_vars)}")
@@ -282,14 +327,23 @@ def main():
     
     args = parser.parse_args()
     
+    from concurrent.futures import ThreadPoolExecutor
+    
     print("🚀 YouTube Summarizer Deployment")
     print("=" * 50)
     print(f"Platform: {args.platform}")
     print(f"Environment: {args.env}")
     print()
     
+    # Independent git queries run concurrently; their results are used below
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = None if args.skip_git_check else executor.submit(run_command, "git status --porcelain")
+        commit_future = executor.submit(run_command, "git rev-parse HEAD", check=False)
+        status_result = status_future.result() if status_future else None
+        commit_result = commit_future.result()
+    
     # Pre-deployment checks
-    if not args.skip_git_check and not check_git_status():
+    if not args.skip_git_check and not check_git_status(status_result):
         if not args.force:
             print("❌ Deployment cancelled")
             sys.exit(1)
@@ -309,7 +363,7 @@ def main():
         print("⚠️  Failed to create backup, continuing anyway...")
     
     # Update version
-    version_data = update_version()
+    version_data = update_version(commit_result)
     
     # Deploy based on platform
     success = False
@@ -161,25 +161,7 @@ def download_nltk_data():
     else:  # Unix-like
         python_path = "venv/bin/python"
     
-    nltk_script = '''
-import nltk
-import ssl
-
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
-
-print("Downloading punkt...")
-nltk.download('punkt', quiet=True)
-print("Downloading stopwords...")
-nltk.download('stopwords', quiet=True)
-print("NLTK data downloaded successfully!")
-'''
-    
-    result = run_command(f'{python_path} -c "{nltk_script}"', shell=True)
+    result = run_command(f"{python_path} scripts/_nltk_bootstrap.py")
     if result is None:
         print("❌ Failed to download NLTK data")
         return False
@@ -3,24 +3,48 @@
 import pytest
 import tempfile
 import os
-from unittest.mock import Mock, patch
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
 from app import app
 from app.models.video import Video, VideoInfo
 from app.models.summary import Summary, SummaryType
 
 
-@pytest.fixture
+# Immutable NLTK results shared by every mock_nltk patch
+MOCK_SENTENCES = (
+    "This is the first sentence.",
+    "This is the second sentence.",
+    "This is the third sentence."
+)
+MOCK_WORDS = ("this", "is", "a", "test", "transcript", "with", "some", "words")
+MOCK_STOP_WORDS = ("is", "a", "the", "with", "some")
+# NLTK attributes the summarizer uses
+NLTK_ATTRIBUTES = ["sent_tokenize", "tokenize", "corpus", "data", "download"]
+
+# Transcript shared by every test through the session-scoped fixture; str is immutable
+SAMPLE_TRANSCRIPT = """
+    Welcome to this tutorial video. Today we're going to learn about Python programming.
+    First, let's talk about variables. Variables are used to store data in Python.
+    You can create a variable by simply assigning a value to it.
+    For example, you can write: name equals "John". This creates a string variable.
+    Next, we'll discuss functions. Functions are reusable blocks of code.
+    You define a function using the def keyword followed by the function name.
+    Remember to practice these concepts to become proficient in Python programming.
+    """
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the Flask application."""
-    app.config['TESTING'] = True
-    app.config['WTF_CSRF_ENABLED'] = False
+    """Create a test client for the Flask application, shared by all tests."""
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
     
+    # Requests carry everything in their bodies, so tests need no client isolation.
+    # Each request pushes its own app context, so none is held open here.
     with app.test_client() as client:
-        with app.app_context():
-            yield client
+        yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video_info():
     """Create a sample VideoInfo object for testing."""
     return VideoInfo(
@@ -34,7 +58,7 @@ def sample_video_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_video(sample_video_info):
     """Create a sample Video object for testing."""
     return Video(
@@ -45,7 +69,7 @@ def sample_video(sample_video_info):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_summary():
     """Create a sample Summary object for testing."""
     return Summary(
@@ -57,27 +81,19 @@ def sample_summary():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript():
     """Provide a sample transcript for testing."""
-    return """
-    Welcome to this tutorial video. Today we're going to learn about Python programming.
-    First, let's talk about variables. Variables are used to store data in Python.
-    You can create a variable by simply assigning a value to it.
-    For example, you can write: name equals "John". This creates a string variable.
-    Next, we'll discuss functions. Functions are reusable blocks of code.
-    You define a function using the def keyword followed by the function name.
-    Remember to practice these concepts to become proficient in Python programming.
-    """
+    return SAMPLE_TRANSCRIPT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_youtube_url():
     """Provide a mock YouTube URL for testing."""
     return "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_youtube_url():
     """Provide an invalid YouTube URL for testing."""
     return "https://www.example.com/not-youtube"
@@ -93,8 +109,11 @@ def temp_cache_dir():
 @pytest.fixture
 def mock_yt_dlp():
     """Mock yt-dlp functionality for testing."""
+    # Bound before patching; inside the patch yt_dlp.YoutubeDL is the mock itself
+    from yt_dlp import YoutubeDL
+    
     with patch('app.utils.summarizer.yt_dlp.YoutubeDL') as mock_ydl:
-        mock_instance = Mock()
+        mock_instance = MagicMock(spec=YoutubeDL)
         mock_ydl.return_value.__enter__.return_value = mock_instance
         
         # Mock extract_info response
@@ -111,47 +130,65 @@ def mock_yt_dlp():
 
 @pytest.fixture
 def mock_transformers():
-    """Mock transformers pipeline for testing."""
-    with patch('app.utils.summarizer.pipeline') as mock_pipeline:
-        mock_summarizer = Mock()
+    """Mock the summarization pipeline for testing, without importing transformers or torch."""
+    # Patched where the pipeline is looked up, so neither the model settings nor
+    # the per-process pipeline cache are involved
+    with patch('app.utils.summarizer.get_summarization_pipeline') as mock_get_pipeline:
+        mock_summarizer = MagicMock(spec=['__call__'])
         mock_summarizer.return_value = [{'summary_text': 'Test summary content'}]
-        mock_pipeline.return_value = mock_summarizer
+        mock_get_pipeline.return_value = mock_summarizer
         yield mock_summarizer
 
 
 @pytest.fixture
-def mock_nltk():
-    """Mock NLTK functionality for testing."""
-    with patch('app.utils.summarizer.nltk') as mock_nltk:
-        # Mock tokenization
-        mock_nltk.sent_tokenize.return_value = [
-            "This is the first sentence.",
-            "This is the second sentence.",
-            "This is the third sentence."
-        ]
-        
-        mock_nltk.tokenize.word_tokenize.return_value = [
-            "this", "is", "a", "test", "transcript", "with", "some", "words"
-        ]
-        
-        # Mock stopwords
-        mock_nltk.corpus.stopwords.words.return_value = ["is", "a", "the", "with", "some"]
-        
-        yield mock_nltk
+def mock_nltk(monkeypatch):
+    """Mock NLTK functionality for testing, without importing NLTK."""
+    from app.utils import summarizer
+    from app.utils.summarizer import _sent_tokenize_cached, get_stop_words
+    
+    # Memoized results from the real or another mocked NLTK must not leak in or out
+    _sent_tokenize_cached.cache_clear()
+    get_stop_words.cache_clear()
+    # Set in the module globals directly: patching the attribute would first
+    # import the real NLTK through the summarizer's lazy module loading
+    mock_nltk = MagicMock(spec=NLTK_ATTRIBUTES)
+    monkeypatch.setitem(vars(summarizer), 'nltk', mock_nltk)
+    
+    # Mock tokenization
+    mock_nltk.sent_tokenize.return_value = MOCK_SENTENCES
+    mock_nltk.tokenize.word_tokenize.return_value = MOCK_WORDS
+    
+    # Mock stopwords
+    mock_nltk.corpus.stopwords.words.return_value = MOCK_STOP_WORDS
+    
+    yield mock_nltk
+    _sent_tokenize_cached.cache_clear()
+    get_stop_words.cache_clear()
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def mock_file_operations():
-    """Mock file operations to avoid actual file I/O during tests."""
+    """Mock file operations for tests that exercise file-touching code paths."""
+    # tempfile.TemporaryDirectory is left real: a mocked directory cannot be
+    # joined into paths, and temp_cache_dir relies on real directories
     with patch('builtins.open'), \
          patch('os.listdir'), \
          patch('os.path.exists'), \
-         patch('os.makedirs'), \
-         patch('tempfile.TemporaryDirectory'):
+         patch('os.makedirs'):
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_video_info_dict():
+    """Video info as returned by extract_video_info, shared by all tests (treat as read-only)."""
+    return {
+        'title': 'Test Video',
+        'channel': 'Test Channel',
+        'description': 'Test description'
+    }
+
+
+@pytest.fixture(scope="session")
 def sample_api_request():
     """Sample API request data for testing."""
     return {
@@ -161,7 +198,7 @@ def sample_api_request():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_api_response():
     """Sample API response data for testing."""
     return {
@@ -176,25 +213,31 @@ def sample_api_response():
 
 
 # Test data constants
-TEST_VIDEO_ID = "dQw4w9WgXcQ"
-TEST_YOUTUBE_URL = f"https://www.youtube.com/watch?v={TEST_VIDEO_ID}"
-TEST_YOUTU_BE_URL = f"https://youtu.be/{TEST_VIDEO_ID}"
-TEST_EMBED_URL = f"https://www.youtube.com/embed/{TEST_VIDEO_ID}"
+@dataclass(frozen=True)
+class _TestURLs:
+    """YouTube URLs in each supported format for one test video."""
+    video_id: str = "dQw4w9WgXcQ"
+    watch: str = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    short: str = "https://youtu.be/dQw4w9WgXcQ"
+    embed: str = "https://www.youtube.com/embed/dQw4w9WgXcQ"
+
+
+URLS = _TestURLs()
 
-INVALID_URLS = [
+INVALID_URLS = (
     "not_a_url",
     "https://www.example.com",
     "https://vimeo.com/123456",
     "youtube.com/watch?v=invalid",  # Missing protocol
     "",
     None
-]
+)
 
-VALID_YOUTUBE_URLS = [
-    TEST_YOUTUBE_URL,
-    TEST_YOUTU_BE_URL,
-    TEST_EMBED_URL,
+VALID_YOUTUBE_URLS = (
+    URLS.watch,
+    URLS.short,
+    URLS.embed,
     "https://www.youtube.com/watch?v=test123&t=30s",
     "https://youtu.be/test123?t=30",
     "https://www.youtube.com/embed/test123?start=30"
-]
+)
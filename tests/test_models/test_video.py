@@ -5,6 +5,20 @@ from datetime import datetime
 from app.models.video import Video, VideoInfo
 
 
+# (url, expected video id) pairs for VideoInfo._extract_video_id
+VIDEO_ID_CASES = [
+    ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/v/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+    ("invalid_url", None),
+    ("", None)
+]
+
+# 400 words: 2 minutes at 200 WPM
+LONG_TRANSCRIPT_400W = " ".join(["word"] * 400)
+
+
 class TestVideoInfo:
     """Test cases for VideoInfo model."""
     
@@ -83,25 +97,24 @@ class TestVideoInfo:
         assert info.description == "Test description"
         assert info.video_id == "test123"
     
-    def test_extract_video_id_various_formats(self):
+    @pytest.mark.parametrize("url,expected_id", VIDEO_ID_CASES)
+    def test_extract_video_id_various_formats(self, url, expected_id):
         """Test video ID extraction from various URL formats."""
-        test_cases = [
-            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
-            ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
-            ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
-            ("https://www.youtube.com/v/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
-            ("invalid_url", None),
-            ("", None)
-        ]
-        
-        for url, expected_id in test_cases:
-            result = VideoInfo._extract_video_id(url)
-            assert result == expected_id, f"Failed for URL: {url}"
+        result = VideoInfo._extract_video_id(url)
+        assert result == expected_id, f"Failed for URL: {url}"
 
 
 class TestVideo:
     """Test cases for Video model."""
     
+    @pytest.fixture(scope="class")
+    def base_video(self, sample_video_info):
+        """A valid Video shared by tests that only read it."""
+        return Video(
+            info=sample_video_info,
+            transcript="This is a sufficiently long transcript with enough content for meaningful summarization."
+        )
+    
     def test_video_creation_basic(self, sample_video_info):
         """Test basic Video creation."""
         video = Video(
@@ -125,23 +138,16 @@ class TestVideo:
     
     def test_video_estimated_reading_time(self, sample_video_info):
         """Test estimated reading time calculation."""
-        # Create transcript with 400 words (should be 2 minutes at 200 WPM)
-        transcript = " ".join(["word"] * 400)
         video = Video(
             info=sample_video_info,
-            transcript=transcript
+            transcript=LONG_TRANSCRIPT_400W
         )
         
         assert video.estimated_reading_time == 2
     
-    def test_video_is_valid_true(self, sample_video_info):
+    def test_video_is_valid_true(self, base_video):
         """Test is_valid property returns True for valid video."""
-        video = Video(
-            info=sample_video_info,
-            transcript="This is a sufficiently long transcript with enough content for meaningful summarization."
-        )
-        
-        assert video.is_valid is True
+        assert base_video.is_valid is True
     
     def test_video_is_valid_false_short_transcript(self, sample_video_info):
         """Test is_valid property returns False for short transcript."""
@@ -223,14 +229,9 @@ class TestVideo:
         assert video.transcript_language == "en"
         assert video.transcript_source == "manual"
     
-    def test_video_validate_success(self, sample_video_info):
+    def test_video_validate_success(self, base_video):
         """Test successful video validation."""
-        video = Video(
-            info=sample_video_info,
-            transcript="This is a sufficiently long transcript with enough content for validation."
-        )
-        
-        errors = video.validate()
+        errors = base_video.validate()
         assert len(errors) == 0
     
     def test_video_validate_errors(self):
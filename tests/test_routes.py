@@ -1,8 +1,22 @@
 # tests/test_routes.py
 
 import pytest
-import json
-from unittest.mock import patch, Mock
+from unittest.mock import patch
+
+
+@pytest.fixture
+def summarize_mocks():
+    """
+    Patch the services used by the summarize route.
+
+    Summary caching is disabled, so results never leak between tests using the same URL.
+    """
+    from app import app
+    
+    with patch.dict(app.config, CACHE_ENABLED=False), \
+            patch('app.services.video_service.VideoService.get_video_data') as get_video_data, \
+            patch('app.services.summary_service.SummaryService.generate_summary_shared') as generate_summary:
+        yield get_video_data, generate_summary
 
 
 class TestRoutes:
@@ -20,28 +34,18 @@ class TestRoutes:
         assert response.status_code == 200
         assert b'YouTube Video Summarizer' in response.data
     
-    @patch('app.routes.run_summarization')
-    @patch('app.routes.get_transcript')
-    @patch('app.routes.extract_video_info')
-    def test_summarize_route_success(self, mock_extract_info, mock_get_transcript, 
-                                   mock_run_summarization, client):
+    def test_summarize_route_success(self, summarize_mocks, sample_video_info_dict, client):
         """Test successful summarization request."""
-        # Mock the functions
-        mock_extract_info.return_value = {
-            'title': 'Test Video',
-            'channel': 'Test Channel',
-            'description': 'Test description'
-        }
-        mock_get_transcript.return_value = "This is a test transcript."
-        mock_run_summarization.return_value = ("Test summary", "test, keywords")
+        # Mock the services
+        get_video_data, summary_result = summarize_mocks
+        get_video_data.return_value = ("This is a test transcript.", sample_video_info_dict)
+        summary_result.return_value = ("Test summary", "test, keywords")
         
         # Make request
-        response = client.post('/summarize', 
-                             data=json.dumps({'url': 'https://www.youtube.com/watch?v=test123'}),
-                             content_type='application/json')
+        response = client.post('/summarize', json={'url': 'https://www.youtube.com/watch?v=test123'})
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'summary' in data
         assert 'keywords' in data
         assert data['summary'] == 'Test summary'
@@ -49,77 +53,53 @@ class TestRoutes:
     
     def test_summarize_route_missing_url(self, client):
         """Test summarization request with missing URL."""
-        response = client.post('/summarize', 
-                             data=json.dumps({}),
-                             content_type='application/json')
+        response = client.post('/summarize', json={})
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
         assert 'URL is required' in data['error']
     
     def test_summarize_route_empty_url(self, client):
         """Test summarization request with empty URL."""
-        response = client.post('/summarize', 
-                             data=json.dumps({'url': ''}),
-                             content_type='application/json')
+        response = client.post('/summarize', json={'url': ''})
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
-    @patch('app.routes.extract_video_info')
-    def test_summarize_route_extract_info_error(self, mock_extract_info, client):
+    def test_summarize_route_extract_info_error(self, summarize_mocks, client):
         """Test summarization when video info extraction fails."""
-        mock_extract_info.side_effect = Exception("Video not found")
+        get_video_data, _ = summarize_mocks
+        get_video_data.side_effect = Exception("Video not found")
         
-        response = client.post('/summarize', 
-                             data=json.dumps({'url': 'https://www.youtube.com/watch?v=test123'}),
-                             content_type='application/json')
+        response = client.post('/summarize', json={'url': 'https://www.youtube.com/watch?v=test123'})
         
         assert response.status_code == 500
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
-    @patch('app.routes.get_transcript')
-    @patch('app.routes.extract_video_info')
-    def test_summarize_route_transcript_error(self, mock_extract_info, mock_get_transcript, client):
+    def test_summarize_route_transcript_error(self, summarize_mocks, client):
         """Test summarization when transcript extraction fails."""
-        mock_extract_info.return_value = {
-            'title': 'Test Video',
-            'channel': 'Test Channel',
-            'description': 'Test description'
-        }
-        mock_get_transcript.side_effect = Exception("No captions available")
+        get_video_data, _ = summarize_mocks
+        get_video_data.side_effect = Exception("No captions available")
         
-        response = client.post('/summarize', 
-                             data=json.dumps({'url': 'https://www.youtube.com/watch?v=test123'}),
-                             content_type='application/json')
+        response = client.post('/summarize', json={'url': 'https://www.youtube.com/watch?v=test123'})
         
         assert response.status_code == 500
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
-    @patch('app.routes.run_summarization')
-    @patch('app.routes.get_transcript')
-    @patch('app.routes.extract_video_info')
-    def test_summarize_route_summarization_error(self, mock_extract_info, mock_get_transcript, 
-                                               mock_run_summarization, client):
+    def test_summarize_route_summarization_error(self, summarize_mocks, sample_video_info_dict, client):
         """Test summarization when summary generation fails."""
-        mock_extract_info.return_value = {
-            'title': 'Test Video',
-            'channel': 'Test Channel',
-            'description': 'Test description'
-        }
-        mock_get_transcript.return_value = "This is a test transcript."
-        mock_run_summarization.side_effect = Exception("Summarization failed")
+        get_video_data, summary_result = summarize_mocks
+        get_video_data.return_value = ("This is a test transcript.", sample_video_info_dict)
+        summary_result.side_effect = Exception("Summarization failed")
         
-        response = client.post('/summarize', 
-                             data=json.dumps({'url': 'https://www.youtube.com/watch?v=test123'}),
-                             content_type='application/json')
+        response = client.post('/summarize', json={'url': 'https://www.youtube.com/watch?v=test123'})
         
         assert response.status_code == 500
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
     def test_summarize_route_invalid_json(self, client):
@@ -139,3 +119,10 @@ class TestRoutes:
         """Test accessing a non-existent route."""
         response = client.get('/nonexistent')
         assert response.status_code == 404
+    
+    def test_json_provider_is_orjson(self, client):
+        """Test request and response bodies go through the orjson provider."""
+        from app import app
+        from app.json_provider import OrjsonProvider
+        
+        assert isinstance(app.json, OrjsonProvider)
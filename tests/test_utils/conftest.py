@@ -0,0 +1,42 @@
+# tests/test_utils/conftest.py
+
+import io
+import pytest
+from unittest.mock import Mock
+
+
+# Subtitle file written by the mocked yt-dlp download
+SUBTITLE_VTT = """WEBVTT
+
+00:00:01.000 --> 00:00:05.000
+This is the first subtitle line.
+
+00:00:05.000 --> 00:00:10.000
+This is the second subtitle line.
+"""
+
+# Number of cues in the large subtitle stress input
+LARGE_VTT_CUES = 100_000
+
+
+@pytest.fixture
+def subtitle_file(monkeypatch):
+    """Make the subtitle download directory contain one English VTT file."""
+    monkeypatch.setattr('os.listdir', lambda path: ['subtitle.en.vtt'])
+    monkeypatch.setattr('builtins.open', lambda *args, **kwargs: io.StringIO(SUBTITLE_VTT))
+
+
+@pytest.fixture
+def mock_professional_summary(monkeypatch):
+    """Replace the enhanced summary builder, as bound in the summarizer module, with a configurable mock."""
+    mock_create = Mock()
+    monkeypatch.setattr('app.utils.summarizer.create_professional_summary', mock_create)
+    return mock_create
+
+
+@pytest.fixture(scope="session")
+def large_vtt_content():
+    """A multi-megabyte VTT document, built once per session."""
+    return "WEBVTT\n\n" + "".join(
+        f"{i * 2}.000 --> {i * 2 + 1}.000\nLine {i}.\n\n" for i in range(LARGE_VTT_CUES)
+    )